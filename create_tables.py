@@ -156,28 +156,23 @@ def create_tables():
         # Execute SQL using Supabase RPC
         print("Executing SQL commands...")
         
-        # Split into individual commands and execute
-        commands = CREATE_TABLES_SQL.strip().split(';')
-        
-        for i, cmd in enumerate(commands):
-            cmd = cmd.strip()
-            if cmd:
-                try:
-                    # Use Supabase's SQL execution
-                    result = supabase.rpc('exec_sql', {'query': cmd}).execute()
-                    print(f"✓ Command {i+1} executed successfully")
-                except Exception as e:
-                    # This might fail if exec_sql function doesn't exist
-                    # In that case, we'll need to use Supabase dashboard
-                    if i == 0:
-                        print(f"\n⚠️  Cannot execute SQL directly via API")
-                        print("\nPlease run the SQL manually:")
-                        print("1. Go to: https://supabase.com/dashboard")
-                        print("2. Select your project")
-                        print("3. Go to: SQL Editor")
-                        print("4. Copy and paste contents from: daily_deals_schema.sql")
-                        print("5. Click 'RUN'\n")
-                        return False
+        # Send the whole script as one query: one round trip instead of one
+        # per statement, and Postgres runs the statements in order
+        statement_count = sum(1 for cmd in CREATE_TABLES_SQL.split(';') if cmd.strip())
+        try:
+            supabase.rpc('exec_sql', {'query': CREATE_TABLES_SQL}).execute()
+            print(f"✓ {statement_count} commands executed successfully")
+        except Exception as e:
+            # This might fail if exec_sql function doesn't exist
+            # In that case, we'll need to use Supabase dashboard
+            print(f"\n⚠️  Cannot execute SQL directly via API")
+            print("\nPlease run the SQL manually:")
+            print("1. Go to: https://supabase.com/dashboard")
+            print("2. Select your project")
+            print("3. Go to: SQL Editor")
+            print("4. Copy and paste contents from: daily_deals_schema.sql")
+            print("5. Click 'RUN'\n")
+            return False
         
         print("\n" + "="*60)
         print("✅ All tables created successfully!")
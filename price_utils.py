@@ -0,0 +1,70 @@
+"""
+Price Utilities
+===============
+Price-string parsing shared by the product scrapers.
+
+Kept free of project imports and fully annotated so the module can be
+compiled ahead of time with mypyc (``mypyc price_utils.py``); the pure
+Python version is used when no compiled extension is present.
+
+Author: AI Assistant
+Date: December 2025
+"""
+
+import re
+from typing import Dict, Final, Optional
+
+
+# Every character re's \s matches in str patterns (what str.isspace() accepts),
+# including the no-break/thin spaces of locale-formatted prices
+_WHITESPACE: Final[str] = (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+)
+
+# Price cleaning: one deletion table for currency symbols/separators/whitespace,
+# one alternation for per-unit prices (₹5/g, ₹10/kg, etc.)
+_PRICE_TRANS: Final[Dict[int, None]] = str.maketrans('', '', '₹$,' + _WHITESPACE)
+_NUM_RE: Final = re.compile(r'\d+\.?\d*')
+_PER_UNIT_RE: Final = re.compile(
+    r'/\s*(?:g|kg|ml|l|unit|piece|item)\b'  # per gram/kg/ml/litre/unit/piece/item
+    r'|\(\s*₹[\d,]+\s*/\s*[gkml]',         # (₹5/g) format
+    re.IGNORECASE
+)
+
+
+def is_per_unit_price(price_str: str) -> bool:
+    """Check if a price string is a per-unit price (₹5/g, ₹10/kg, etc.)."""
+    return _PER_UNIT_RE.search(price_str) is not None
+
+
+def clean_price(price_str: Optional[str], check_per_unit: bool = True) -> Optional[float]:
+    """
+    Extract numeric price from string.
+
+    Args:
+        price_str: Price string with currency symbols
+        check_per_unit: If True, reject per-unit prices (₹5/g, ₹10/kg, etc.)
+
+    Returns:
+        Float price or None
+    """
+    if not price_str:
+        return None
+
+    # Check for per-unit pricing patterns (reject these)
+    if check_per_unit and is_per_unit_price(price_str):
+        return None  # Reject per-unit prices
+
+    # Remove currency symbols, commas and whitespace in a single pass
+    cleaned = price_str.translate(_PRICE_TRANS)
+
+    # Extract first number found
+    match = _NUM_RE.search(cleaned)
+    if match:
+        try:
+            return float(match.group())
+        except ValueError:
+            return None
+    return None
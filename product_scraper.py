@@ -9,13 +9,26 @@ Date: December 2025
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+import soupsieve as sv
 from typing import Dict, Optional, List
 import re
 import json
 import time
+import atexit
+import functools
+import asyncio
+import os
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import timedelta
 from urllib.parse import urlparse
+from html import unescape
+
+
+from price_utils import clean_price
 
 # Selenium imports for JS-rendered sites
 try:
@@ -31,31 +44,322 @@ except ImportError:
     SELENIUM_AVAILABLE = False
 
 
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """
+    Resolve the chromedriver path once per process.
+    
+    ChromeDriverManager().install() checks versions on disk (and sometimes
+    the network), so only the first Selenium fallback pays for it.
+    """
+    return ChromeDriverManager().install()
+
+
+@functools.lru_cache(maxsize=1)
+def _chrome_options(user_agent: str) -> 'Options':
+    """
+    Build the headless Chrome options once and share them between drivers.
+    
+    Options are only read when a session starts, so recycled drivers can
+    reuse the same object.
+    """
+    chrome_options = Options()
+    for arg in ('--headless', '--no-sandbox', '--disable-dev-shm-usage',
+                '--disable-gpu', '--window-size=1920,1080',
+                f'user-agent={user_agent}'):
+        chrome_options.add_argument(arg)
+    
+    # Pages are only parsed for HTML/JSON-LD, so stop at DOMContentLoaded
+    # and don't download images (image URLs come from the markup)
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option(
+        'prefs', {'profile.managed_default_content_settings.images': 2}
+    )
+    return chrome_options
+
+
+# Brotli lets urllib3 decode 'br' responses (smaller HTML from Flipkart/Amazon)
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+# Async HTTP for concurrent batch scraping
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Playwright for batch rendering of JS-heavy sites
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+# Persistent HTTP cache for product pages (optional)
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Where the opt-in page cache lives (absolute, independent of the working dir)
+SCRAPER_CACHE_PATH = os.path.abspath(os.getenv(
+    'SCRAPER_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scraper_cache')
+))
+
+# selectolax (Lexbor) for scrapers whose lookups are all plain CSS selectors
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Fast JSON parsing for large __NEXT_DATA__ / JSON-LD blobs
+try:
+    import orjson
+    
+    def _json_loads(text):
+        # orjson rejects str subclasses such as bs4's Script/NavigableString
+        return orjson.loads(str(text))
+except ImportError:
+    _json_loads = json.loads
+
+
+# Page-wide price/percentage tokens, scanned once over the page text
+# Per-unit prices (₹1,200/kg) are skipped, as clean_price() rejects them; the
+# digit guard stops the amount backtracking to dodge the unit lookahead
+_PRICE_RE = re.compile(
+    r'₹\s*([\d,]+(?:\.\d+)?)(?![\d.,]|\s*/\s*(?:g|kg|ml|l|unit|piece|item)\b)',
+    re.IGNORECASE
+)
+_PCT_RE = re.compile(r'(\d+)%')
+_PCT_OFF_RE = re.compile(r'(\d+)%\s*off', re.IGNORECASE)
+
+# Raw-HTML lookups that let the Flipkart fast path skip BeautifulSoup
+_NEXT_DATA_RE = re.compile(r'<script[^>]*id=["\']__NEXT_DATA__["\'][^>]*>(.+?)</script>', re.DOTALL)
+_OG_IMAGE_RE = re.compile(
+    r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)["\']', re.IGNORECASE
+)
+
+# Number/rating patterns used by the Ajio, Meesho and Shopsy scrapers
+_INT_RE = re.compile(r'(\d+)')
+_FLOAT_RE = re.compile(r'(\d+\.?\d*)')
+_RUPEE_RE = re.compile(r'₹\s*\d+')
+_RATING_STAR_RE = re.compile(r'(\d+\.?\d*)\s*★')
+_TITLE_CLASS_RE = re.compile(r'.*title.*', re.I)
+
+# Flipkart class selectors, compiled once. Each tuple is in priority order
+# (a comma-joined selector list would return matches in document order).
+_FLIPKART_TITLE_SELS = tuple(sv.compile(css) for css in (
+    'span.VU-ZEz', 'h1.yhB1nd', 'span.B_NuCI', 'h1._6EBuvT', 'span.G6XhRU',
+))
+_FLIPKART_MRP_SELS = tuple(sv.compile(css) for css in (
+    'div._3I9_wc._27UcVY', 'div._3auQ3N._1POkHg', r'div.yRaY8j.A6\+E6v',
+    'div._3I9_wc._2p6lqe', 'div.yRaY8j.ZYYwLA',
+))
+_FLIPKART_PRICE_SELS = tuple(sv.compile(css) for css in (
+    'div._30jeq3._16Jk6d', 'div._30jeq3', 'div._3qQ9m1', 'div.Nx9bqj.CxhGGd',
+    'div._25b18c', 'div.Nx9bqj', 'span.Nx9bqj',
+))
+_FLIPKART_RATING_SELS = tuple(sv.compile(css) for css in (
+    'div._3LWZlK', 'div.XQDdHH',
+))
+
+# Meesho's shared styled-components classes (sc-eDvSVe) also match unrelated
+# text, so its selectors stay in priority order rather than one combined list
+_MEESHO_TITLE_SELS = tuple(sv.compile(css) for css in (
+    'h1.Title__HeadingWrapper-sc-1j0fgbz-0', 'span.sc-eDvSVe', 'h1',
+))
+_MEESHO_MRP_SELS = tuple(sv.compile(css) for css in (
+    'p.sc-eDvSVe', 'span.Text-sc-16kzopp-0',
+))
+_MEESHO_PRICE_SELS = tuple(sv.compile(css) for css in (
+    'h4.Price__BaseText-sc-w7bcyz-0', 'span.sc-eDvSVe',
+))
+
+_MEESHO_RATING_SELS = tuple(sv.compile(css) for css in (
+    'p.sc-eDvSVe', 'span.Rating__BaseText-sc-1dcnzc3-0',
+))
+
+# Shopsy uses Flipkart's class names, in the same priority order
+_SHOPSY_TITLE_SELS = tuple(sv.compile(css) for css in (
+    'span.VU-ZEz', 'h1.yhB1nd', 'span.B_NuCI', 'h1._6EBuvT',
+))
+_SHOPSY_MRP_SELS = tuple(sv.compile(css) for css in (
+    'div._3I9_wc._27UcVY', 'div._3auQ3N._1POkHg', r'div.yRaY8j.A6\+E6v', 'div._3I9_wc._2p6lqe',
+))
+_SHOPSY_PRICE_SELS = tuple(sv.compile(css) for css in (
+    'div._30jeq3._16Jk6d', 'div._30jeq3', 'div._3qQ9m1', 'div.Nx9bqj.CxhGGd',
+    'div._25b18c', 'span.Nx9bqj',
+))
+_SHOPSY_RATING_SELS = tuple(sv.compile(css) for css in (
+    'div._3LWZlK', 'div.XQDdHH',
+))
+_SHOPSY_DATA_SCRIPTS_SEL = sv.compile('script#__NEXT_DATA__, script[type="application/ld+json"]')
+
+# Flipkart seller detection: "Sold by <name>" and Assured markers in one pass
+_SELLER_RE = re.compile(r'flipkart assured|f-assured|sold by\s+([^\n]+)', re.IGNORECASE)
+_ASSURED_ALT_RE = re.compile(r'flipkart assured', re.IGNORECASE)
+
+# 'raw_html' snippet bounds: chars sliced from the page, then UTF-8 bytes kept
+RAW_HTML_MAX_CHARS = 5000
+RAW_HTML_MAX_BYTES = 4096
+
+class SeleniumPool:
+    """
+    Bounded pool of reusable headless Chrome drivers for the Selenium fallbacks.
+    
+    At most MAX_DRIVERS Chromes run at once, however many worker threads ask
+    (asyncio.to_thread alone can run dozens); callers check one out with
+    ``with SeleniumPool.driver() as driver:`` and wait while all are busy.
+    Idle drivers are kept for the next fetch (Chrome cold start costs 1-2 s
+    per URL), recycled after MAX_USES pages to contain memory leaks, dropped
+    when a fetch raises, and quit by close_idle() when a batch finishes and
+    by shutdown() at interpreter exit.
+    """
+    
+    MAX_DRIVERS = 2
+    MAX_USES = 50
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    
+    _slots = threading.BoundedSemaphore(MAX_DRIVERS)
+    _idle = []  # [driver, uses] entries not checked out
+    _drivers = set()
+    _drivers_lock = threading.Lock()
+    _atexit_registered = False
+    
+    @classmethod
+    @contextmanager
+    def driver(cls):
+        """Check out a driver for one fetch; it is quit if the fetch raises."""
+        with cls._slots:
+            with cls._drivers_lock:
+                entry = cls._idle.pop() if cls._idle else None
+            if entry is None:
+                entry = [cls._start_driver(), 0]
+            driver = entry[0]
+            
+            try:
+                yield driver
+            except BaseException:
+                cls._discard(driver)
+                raise
+            
+            entry[1] += 1
+            if entry[1] >= cls.MAX_USES:
+                cls._discard(driver)
+                return
+            with cls._drivers_lock:
+                # Skip drivers quit by shutdown() while checked out
+                if driver in cls._drivers:
+                    cls._idle.append(entry)
+    
+    @classmethod
+    def _start_driver(cls):
+        """Start a new headless Chrome and register it for shutdown."""
+        service = Service(_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=_chrome_options(cls.USER_AGENT))
+        
+        with cls._drivers_lock:
+            cls._drivers.add(driver)
+            if not cls._atexit_registered:
+                atexit.register(cls.shutdown)
+                cls._atexit_registered = True
+        return driver
+    
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    @classmethod
+    def _discard(cls, driver):
+        """Quit one driver (after a crash, or to recycle it)."""
+        with cls._drivers_lock:
+            cls._drivers.discard(driver)
+        cls._quit(driver)
+    
+    @classmethod
+    def close_idle(cls):
+        """Quit the drivers nobody has checked out (end of a batch)."""
+        with cls._drivers_lock:
+            drivers = [driver for driver, _ in cls._idle]
+            cls._idle.clear()
+            cls._drivers.difference_update(drivers)
+        for driver in drivers:
+            cls._quit(driver)
+    
+    @classmethod
+    def shutdown(cls):
+        """Quit every pooled driver."""
+        with cls._drivers_lock:
+            drivers = list(cls._drivers)
+            cls._drivers.clear()
+            cls._idle.clear()
+        for driver in drivers:
+            cls._quit(driver)
+
+
 class BaseProductScraper(ABC):
     """
     Abstract base class for site-specific product scrapers.
     """
     
-    def __init__(self, timeout: int = 15, max_retries: int = 3):
+    def __init__(self, timeout: int = 15, max_retries: int = 3, use_cache: bool = False):
         """
         Initialize scraper.
         
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
+            use_cache: Serve pages from the on-disk cache (bulk refreshes only;
+                live price/stock checks must leave this off)
         """
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = requests.Session()
+        self.use_cache = use_cache
+        self.session = self._create_session()
         self._setup_session()
     
+    def _create_session(self) -> requests.Session:
+        """
+        Create the HTTP session, backed by an on-disk cache when use_cache is
+        set and requests-cache is installed.
+        
+        Cached pages honour Cache-Control/ETag and otherwise expire after 6 hours
+        (the deal refresh cadence); a stale copy is served if the site errors out.
+        """
+        if not (self.use_cache and REQUESTS_CACHE_AVAILABLE):
+            return requests.Session()
+        return requests_cache.CachedSession(
+            SCRAPER_CACHE_PATH,
+            backend='sqlite',
+            expire_after=timedelta(hours=6),
+            cache_control=True,
+            allowable_codes=(200,),
+            stale_if_error=True,
+        )
+    
     def _setup_session(self):
         """Setup session with headers and configuration."""
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Only advertise br when urllib3 can decode it
+            'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate',
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -63,8 +367,17 @@ class BaseProductScraper(ABC):
             'Sec-Fetch-Mode': 'navigate',
             'Sec-Fetch-Site': 'none'
         })
+        
+        # Keep-alive connection pool per host. No transport-level retries:
+        # _fetch_page's backoff loop is the only retry layer, so a 429 is
+        # never retried immediately underneath it
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    # Domain substrings this scraper handles (set by each subclass)
+    DOMAINS = ()
     
-    @abstractmethod
     def can_handle(self, url: str) -> bool:
         """
         Check if this scraper can handle the given URL.
@@ -75,21 +388,82 @@ class BaseProductScraper(ABC):
         Returns:
             True if scraper can handle this URL
         """
-        pass
+        return self.can_handle_lower(url.lower())
+    
+    def can_handle_lower(self, url_lower: str) -> bool:
+        """Same as can_handle() for an already-lowercased URL."""
+        return any(domain in url_lower for domain in self.DOMAINS)
     
     @abstractmethod
-    def scrape(self, url: str) -> Dict:
+    def scrape(self, url: str, html: Optional[str] = None, include_raw_html: bool = False) -> Dict:
         """
         Scrape product data from URL.
         
         Args:
             url: Product URL
+            html: Already-fetched page HTML (skips the initial fetch); '' means
+                the fetch was already tried and failed, so only fallbacks run
+            include_raw_html: Include the start of the HTML (<= 4 KB) as 'raw_html'
             
         Returns:
             Dict containing extracted product data
         """
         pass
     
+    # Whether the page needs a real browser to render its product data
+    # (scrape_product_batch renders these with Playwright)
+    JS_RENDERED = False
+    
+    # Whether scrape_async should prefetch the page over aiohttp. Scrapers that
+    # go straight to Selenium leave this off and run entirely in a worker thread.
+    ASYNC_PREFETCH = True
+    
+    async def scrape_async(self, url: str, session=None) -> Dict:
+        """
+        Async variant of scrape() for batch scraping.
+        
+        The page is fetched with aiohttp when a session is given; parsing and
+        any Selenium fallback stay synchronous and run in a worker thread.
+        
+        Args:
+            url: Product URL
+            session: Shared aiohttp.ClientSession (optional)
+            
+        Returns:
+            Dict containing extracted product data
+        """
+        html = None
+        if session is not None and self.ASYNC_PREFETCH:
+            # A failed prefetch already used up its retries; '' tells scrape()
+            # to skip its own fetch and go straight to the fallbacks
+            html = await self._fetch_page_async(url, session) or ''
+        return await asyncio.to_thread(self.scrape, url, html)
+    
+    async def _fetch_page_async(self, url: str, session) -> Optional[str]:
+        """
+        Fetch HTML content from URL with retries using aiohttp.
+        
+        Args:
+            url: URL to fetch
+            session: aiohttp.ClientSession to use
+            
+        Returns:
+            HTML content or None if failed
+        """
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        for attempt in range(self.max_retries):
+            try:
+                async with session.get(url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    continue
+                print(f"❌ Failed to fetch {url}: {e}")
+                return None
+        return None
+    
     def _fetch_page(self, url: str) -> Optional[str]:
         """
         Fetch HTML content from URL with retries.
@@ -104,6 +478,11 @@ class BaseProductScraper(ABC):
             try:
                 response = self.session.get(url, timeout=self.timeout)
                 response.raise_for_status()
+                # Without a declared charset, requests either guesses via
+                # charset detection (slow on big pages) or assumes
+                # ISO-8859-1 for text/html (garbles ₹); these sites serve UTF-8
+                if 'charset' not in response.headers.get('Content-Type', '').lower():
+                    response.encoding = 'utf-8'
                 return response.text
             except requests.exceptions.RequestException as e:
                 if attempt < self.max_retries - 1:
@@ -113,6 +492,54 @@ class BaseProductScraper(ABC):
                 return None
         return None
     
+    def _make_soup(self, html: str) -> BeautifulSoup:
+        """
+        Parse HTML with the C-backed lxml parser.
+        
+        Falls back to the pure-Python html.parser if lxml is missing or
+        chokes on a malformed page.
+        """
+        try:
+            return BeautifulSoup(html, 'lxml')
+        except Exception:
+            return BeautifulSoup(html, 'html.parser')
+    
+    @staticmethod
+    def _first_match(soup: BeautifulSoup, selectors, extract, all_matches: bool = False):
+        """
+        Try compiled selectors in priority order and return the first truthy
+        value extract(element) gives, or None.
+        
+        Only each selector's first element is tried (select_one), since broad
+        shared classes also match unrelated elements further down the page;
+        all_matches=True tries every element a selector matches instead.
+        """
+        for selector in selectors:
+            if all_matches:
+                elems = selector.iselect(soup)
+            else:
+                elem = selector.select_one(soup)
+                elems = (elem,) if elem is not None else ()
+            for elem in elems:
+                value = extract(elem)
+                if value:
+                    return value
+        return None
+    
+    @staticmethod
+    def _raw_html_snippet(html: str, include_raw_html: bool) -> Optional[str]:
+        """
+        Build the 'raw_html' value: the start of the page, capped at
+        RAW_HTML_MAX_BYTES of UTF-8 so it fits the DB column.
+        
+        The result is an independent copy, so the full page string can be
+        freed as soon as the scraper returns.
+        """
+        if not include_raw_html or not html:
+            return None
+        snippet = html[:RAW_HTML_MAX_CHARS]
+        return snippet.encode('utf-8', 'ignore')[:RAW_HTML_MAX_BYTES].decode('utf-8', 'ignore')
+    
     def _clean_price(self, price_str: str, check_per_unit: bool = True) -> Optional[float]:
         """
         Extract numeric price from string.
@@ -124,46 +551,41 @@ class BaseProductScraper(ABC):
         Returns:
             Float price or None
         """
-        if not price_str:
-            return None
-        
-        # Check for per-unit pricing patterns (reject these)
-        if check_per_unit:
-            per_unit_patterns = [
-                r'/\s*g\b',      # per gram
-                r'/\s*kg\b',     # per kilogram
-                r'/\s*ml\b',     # per milliliter
-                r'/\s*l\b',      # per liter
-                r'/\s*unit\b',   # per unit
-                r'/\s*piece\b',  # per piece
-                r'/\s*item\b',   # per item
-                r'\(\s*₹[\d,]+\s*/\s*[gkml]',  # (₹5/g) format
-            ]
-            for pattern in per_unit_patterns:
-                if re.search(pattern, price_str, re.IGNORECASE):
-                    return None  # Reject per-unit prices
-        
-        # Remove currency symbols and commas
-        price_str = re.sub(r'[₹$,\s]', '', price_str)
-        
-        # Extract first number found
-        match = re.search(r'(\d+\.?\d*)', price_str)
-        if match:
-            try:
-                return float(match.group(1))
-            except ValueError:
-                return None
-        return None
+        return clean_price(price_str, check_per_unit)
     
     def _extract_json_ld(self, soup: BeautifulSoup) -> Optional[Dict]:
         """Extract JSON-LD structured data if available."""
-        try:
-            script_tag = soup.find('script', {'type': 'application/ld+json'})
-            if script_tag and script_tag.string:
-                return json.loads(script_tag.string)
-        except Exception:
-            pass
-        return None
+        blocks = self._extract_json_ld_all(soup)
+        return blocks[0] if blocks else None
+    
+    def _extract_json_ld_all(self, soup: BeautifulSoup, script_tags: Optional[List] = None) -> List:
+        """
+        Parse every JSON-LD script on the page once.
+        
+        The parsed list is cached on the soup so repeated lookups don't
+        re-find or re-deserialize the same scripts. Callers that already
+        collected the script tags can pass them to skip the DOM walk.
+        """
+        # Read the instance dict directly: Tag.__getattr__ turns unknown
+        # attributes into a find() call
+        cached = soup.__dict__.get('_jsonld_cache')
+        if cached is not None:
+            return cached
+        
+        if script_tags is None:
+            script_tags = soup.find_all('script', type='application/ld+json')
+        
+        blocks = []
+        for script_tag in script_tags:
+            if not script_tag.string:
+                continue
+            try:
+                blocks.append(_json_loads(script_tag.string))
+            except Exception:
+                pass
+        
+        soup._jsonld_cache = blocks
+        return blocks
     
     def _is_valid_product_image(self, img_url: str) -> bool:
         """
@@ -395,54 +817,40 @@ class BaseProductScraper(ABC):
 class AmazonScraper(BaseProductScraper):
     """Scraper for Amazon India product pages with Selenium fallback."""
     
-    def can_handle(self, url: str) -> bool:
-        """Check if URL is an Amazon product page."""
-        return 'amazon.in' in url.lower() or 'amazon.com' in url.lower()
+    DOMAINS = ('amazon.in', 'amazon.com')
     
     def _fetch_with_selenium(self, url: str) -> Optional[str]:
         """Fetch with Selenium as fallback for bot detection."""
         if not SELENIUM_AVAILABLE:
             return None
         
-        driver = None
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(20)
-            driver.get(url)
-            
-            # Wait for product title
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "productTitle"))
-                )
-            except:
-                time.sleep(2)
-            
-            return driver.page_source
+            with SeleniumPool.driver() as driver:
+                driver.set_page_load_timeout(20)
+                driver.get(url)
+                
+                # Wait for product title
+                try:
+                    WebDriverWait(driver, 10).until(
+                        EC.presence_of_element_located((By.ID, "productTitle"))
+                    )
+                except:
+                    time.sleep(2)
+                
+                return driver.page_source
         except Exception as e:
             print(f"⚠️ Selenium fallback failed: {e}")
             return None
-        finally:
-            if driver:
-                driver.quit()
     
-    def scrape(self, url: str) -> Dict:
+    def scrape(self, url: str, html: Optional[str] = None, include_raw_html: bool = False) -> Dict:
         """
         Scrape Amazon product page with Selenium fallback.
         
         Returns:
             Dict with keys: title, mrp, offer_price, availability, rating, seller, raw_html
         """
-        html = self._fetch_page(url)
+        if html is None:
+            html = self._fetch_page(url)
         selenium_retry = False
         
         # Check if we hit CAPTCHA/bot detection and need Selenium
@@ -471,7 +879,7 @@ class AmazonScraper(BaseProductScraper):
                 'raw_html': None
             }
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._make_soup(html)
         
         # Initialize all variables first
         title = None
@@ -829,7 +1237,7 @@ class AmazonScraper(BaseProductScraper):
             'seller_info': seller_info if seller_info else None,
             'product_image_url': image_data.get('main_image'),
             'additional_images': image_data.get('additional_images', []),
-            'raw_html': html[:5000],  # Store first 5000 chars for LLM analysis
+            'raw_html': self._raw_html_snippet(html, include_raw_html),  # Page head for LLM analysis
             'error': None
         }
 
@@ -837,52 +1245,128 @@ class AmazonScraper(BaseProductScraper):
 class FlipkartScraper(BaseProductScraper):
     """Scraper for Flipkart product pages with Selenium fallback."""
     
-    def can_handle(self, url: str) -> bool:
-        """Check if URL is a Flipkart product page."""
-        return 'flipkart.com' in url.lower()
+    DOMAINS = ('flipkart.com',)
     
     def _fetch_with_selenium_fallback(self, url: str) -> Optional[str]:
         """Fetch with Selenium if available (for JS-rendered content)."""
         if not SELENIUM_AVAILABLE:
             return self._fetch_page(url)
         
-        driver = None
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-            
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(20)
+            with SeleniumPool.driver() as driver:
+                driver.set_page_load_timeout(20)
+                driver.get(url)
+                
+                # Wait for price element
+                try:
+                    WebDriverWait(driver, 8).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='price'], span[class*='price']"))
+                    )
+                except:
+                    time.sleep(2)
+                
+                return driver.page_source
+                
+        except Exception as e:
+            print(f"⚠️ Selenium fallback failed: {e}")
+            return self._fetch_page(url)
+    
+    def _extract_next_data_images(self, product_data: Dict) -> Dict:
+        """
+        Pull product images from the __NEXT_DATA__ product dict.
+        
+        Flipkart image URLs are templates like .../image/{@width}/{@height}/x.jpeg?q={@quality}.
+        """
+        images = {'main_image': None, 'additional_images': []}
+        media = product_data.get('media') or {}
+        if not isinstance(media, dict):
+            return images
+        
+        for entry in media.get('images') or []:
+            img_url = entry.get('url') if isinstance(entry, dict) else entry
+            if not isinstance(img_url, str):
+                continue
+            img_url = img_url.replace('{@width}', '800').replace('{@height}', '800')
+            img_url = self._clean_image_url(img_url)
+            if not self._is_valid_product_image(img_url):
+                continue
+            if not images['main_image']:
+                images['main_image'] = img_url
+            elif img_url not in images['additional_images']:
+                images['additional_images'].append(img_url)
+        return images
+    
+    def _scrape_from_next_data(self, html: str, url: str, include_raw_html: bool = False) -> Optional[Dict]:
+        """
+        Build the result from the __NEXT_DATA__ JSON without parsing the DOM.
+        
+        Returns:
+            Result dict, or None if the page has no usable title/price in __NEXT_DATA__
+        """
+        match = _NEXT_DATA_RE.search(html)
+        if not match:
+            return None
+        
+        try:
+            data = _json_loads(match.group(1))
+            page_props = data.get('props', {}).get('pageProps', {})
             
-            driver.get(url)
+            # Extract from Next.js data if available
+            product_data = page_props.get('data') or page_props.get('product') or page_props.get('pageData')
+            if not product_data or not isinstance(product_data, dict):
+                return None
             
-            # Wait for price element
-            try:
-                WebDriverWait(driver, 8).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='price'], span[class*='price']"))
-                )
-            except:
-                time.sleep(2)
+            title = product_data.get('title') or product_data.get('name')
+            pricing = product_data.get('pricing') or {}
+            offer_price = None
+            mrp = None
+            if pricing:
+                offer_price = (pricing.get('finalPrice') or {}).get('value')
+                mrp = (pricing.get('mrp') or {}).get('value')
+            if not mrp:
+                mrp = product_data.get('mrp')
             
-            return driver.page_source
+            rating_data = product_data.get('rating', {})
+            rating = rating_data.get('average') if rating_data else None
             
-        except Exception as e:
-            print(f"⚠️ Selenium fallback failed: {e}")
-            return self._fetch_page(url)
-        finally:
-            if driver:
-                driver.quit()
+            seller_data = product_data.get('seller') or {}
+            seller_name = seller_data.get('name') if isinstance(seller_data, dict) else None
+        except Exception:
+            return None
+        
+        if not (title and offer_price):
+            return None
+        
+        # Images: __NEXT_DATA__ media, then og:image, and only then the DOM
+        image_data = self._extract_next_data_images(product_data)
+        if not image_data['main_image']:
+            og_match = _OG_IMAGE_RE.search(html)
+            if og_match:
+                img_url = self._clean_image_url(unescape(og_match.group(1)))
+                if self._is_valid_product_image(img_url):
+                    image_data['main_image'] = img_url
+        if not image_data['main_image']:
+            image_data = self._extract_images(self._make_soup(html), url)
+        
+        return {
+            'success': True,
+            'title': title,
+            'mrp': mrp,
+            'offer_price': offer_price,
+            'availability': 'Available',
+            'rating': rating,
+            'seller': seller_name or 'Flipkart',
+            'product_image_url': image_data.get('main_image'),
+            'additional_images': image_data.get('additional_images', []),
+            'raw_html': self._raw_html_snippet(html, include_raw_html),
+            'error': None
+        }
     
-    def scrape(self, url: str) -> Dict:
+    def scrape(self, url: str, html: Optional[str] = None, include_raw_html: bool = False) -> Dict:
         """Scrape Flipkart product page with intelligent fallback."""
         # Try regular fetch first (faster)
-        html = self._fetch_page(url)
+        if html is None:
+            html = self._fetch_page(url)
         
         # If regular fetch fails or returns minimal content, use Selenium
         if not html or len(html) < 10000:
@@ -896,59 +1380,22 @@ class FlipkartScraper(BaseProductScraper):
                 'raw_html': None
             }
         
-        soup = BeautifulSoup(html, 'html.parser')
+        # Fast path: pull __NEXT_DATA__ straight out of the HTML so modern
+        # pages never pay for a full BeautifulSoup parse
+        result = self._scrape_from_next_data(html, url, include_raw_html)
+        if result:
+            return result
         
-        # Quick check: if page has __NEXT_DATA__, parse it
-        next_data_script = soup.find('script', id='__NEXT_DATA__')
-        if next_data_script and next_data_script.string:
-            try:
-                data = json.loads(next_data_script.string)
-                page_props = data.get('props', {}).get('pageProps', {})
-                
-                # Extract from Next.js data if available
-                product_data = page_props.get('data') or page_props.get('product') or page_props.get('pageData')
-                if product_data and isinstance(product_data, dict):
-                    title = product_data.get('title') or product_data.get('name')
-                    pricing = product_data.get('pricing', {})
-                    offer_price = None
-                    mrp = None
-                    if pricing:
-                        offer_price = pricing.get('finalPrice', {}).get('value')
-                        mrp = pricing.get('mrp', {}).get('value')
-                    
-                    rating_data = product_data.get('rating', {})
-                    rating = rating_data.get('average') if rating_data else None
-                    
-                    # If we got data from __NEXT_DATA__, use it
-                    if title and offer_price:
-                        image_data = self._extract_images(soup, url)
-                        return {
-                            'success': True,
-                            'title': title,
-                            'mrp': mrp,
-                            'offer_price': offer_price,
-                            'availability': 'Available',
-                            'rating': rating,
-                            'seller': 'Flipkart',
-                            'product_image_url': image_data.get('main_image'),
-                            'additional_images': image_data.get('additional_images', []),
-                            'raw_html': html[:5000],
-                            'error': None
-                        }
-            except:
-                pass
+        soup = self._make_soup(html)
+        
+        # Page text, one text node per line; the regex fallbacks below scan
+        # this instead of walking the tree again
+        page_text = soup.get_text('\n', strip=True)
         
         # Extract title - try multiple selectors as Flipkart changes frequently
         title = None
-        title_selectors = [
-            ('span', {'class': 'VU-ZEz'}),
-            ('h1', {'class': 'yhB1nd'}),
-            ('span', {'class': 'B_NuCI'}),
-            ('h1', {'class': '_6EBuvT'}),
-            ('span', {'class': 'G6XhRU'}),
-        ]
-        for tag, attrs in title_selectors:
-            title_elem = soup.find(tag, attrs=attrs)
+        for selector in _FLIPKART_TITLE_SELS:
+            title_elem = selector.select_one(soup)
             if title_elem:
                 title = title_elem.get_text().strip()
                 break
@@ -963,15 +1410,8 @@ class FlipkartScraper(BaseProductScraper):
         mrp = None
         
         # Approach 1: Known class selectors
-        mrp_selectors = [
-            ('div', {'class': '_3I9_wc _27UcVY'}),
-            ('div', {'class': '_3auQ3N _1POkHg'}),
-            ('div', {'class': 'yRaY8j A6+E6v'}),
-            ('div', {'class': '_3I9_wc _2p6lqe'}),
-            ('div', {'class': 'yRaY8j ZYYwLA'}),
-        ]
-        for tag, attrs in mrp_selectors:
-            mrp_elem = soup.find(tag, attrs=attrs)
+        for selector in _FLIPKART_MRP_SELS:
+            mrp_elem = selector.select_one(soup)
             if mrp_elem:
                 elem_text = mrp_elem.get_text()
                 # Skip per-unit pricing
@@ -1009,29 +1449,15 @@ class FlipkartScraper(BaseProductScraper):
         
         # Approach 4: Look for "X% off" text and calculate MRP
         if not mrp:
-            for elem in soup.find_all(string=re.compile(r'\d+%\s*off', re.IGNORECASE)):
-                pct_match = re.search(r'(\d+)%', elem)
-                if pct_match:
-                    try:
-                        discount_pct = float(pct_match.group(1))
-                        # We'll calculate after getting offer_price
-                        break
-                    except:
-                        pass
+            pct_match = _PCT_OFF_RE.search(page_text)
+            if pct_match:
+                # We'll calculate after getting offer_price
+                discount_pct = float(pct_match.group(1))
         
         # Extract offer price (current price)
         offer_price = None
-        price_selectors = [
-            ('div', {'class': '_30jeq3 _16Jk6d'}),
-            ('div', {'class': '_30jeq3'}),
-            ('div', {'class': '_3qQ9m1'}),
-            ('div', {'class': 'Nx9bqj CxhGGd'}),
-            ('div', {'class': '_25b18c'}),
-            ('div', {'class': 'Nx9bqj'}),
-            ('span', {'class': 'Nx9bqj'}),
-        ]
-        for tag, attrs in price_selectors:
-            price_elem = soup.find(tag, attrs=attrs)
+        for selector in _FLIPKART_PRICE_SELS:
+            price_elem = selector.select_one(soup)
             if price_elem:
                 offer_price = self._clean_price(price_elem.get_text())
                 if offer_price:
@@ -1077,10 +1503,13 @@ class FlipkartScraper(BaseProductScraper):
         if not mrp and offer_price:
             # Look for "X% off" text (more aggressive search)
             discount_pct = None
-            for elem in soup.find_all(string=re.compile(r'\d+%', re.IGNORECASE)):
-                text = elem.strip()
-                if 'off' in text.lower() or 'discount' in text.lower():
-                    pct_match = re.search(r'(\d+)%', text)
+            # One text node per line; stop at the first usable discount
+            for text in page_text.split('\n'):
+                if '%' not in text:
+                    continue
+                text_lower = text.lower()
+                if 'off' in text_lower or 'discount' in text_lower:
+                    pct_match = _PCT_RE.search(text)
                     if pct_match:
                         try:
                             discount_pct = float(pct_match.group(1))
@@ -1107,16 +1536,12 @@ class FlipkartScraper(BaseProductScraper):
         
         # Approach 6: Look for any strikethrough or crossed price near the offer price
         if not mrp and offer_price:
-            # Find all prices on page
-            all_prices = []
-            for elem in soup.find_all(string=re.compile(r'₹\s*[\d,]+')):
-                price = self._clean_price(elem)
-                if price and price > offer_price and price < offer_price * 3:  # Within reasonable range
-                    all_prices.append(price)
+            # Find all prices on page in one regex pass
+            upper = offer_price * 3  # Within reasonable range
+            all_prices = (float(s.replace(',', '')) for s in _PRICE_RE.findall(page_text))
             
             # If we found higher prices, pick the lowest one as likely MRP
-            if all_prices:
-                mrp = min(all_prices)
+            mrp = min((p for p in all_prices if offer_price < p < upper), default=None)
         
         # Extract availability
         availability = "Available"  # Default
@@ -1126,12 +1551,8 @@ class FlipkartScraper(BaseProductScraper):
         
         # Extract rating
         rating = None
-        rating_selectors = [
-            ('div', {'class': '_3LWZlK'}),
-            ('div', {'class': 'XQDdHH'}),
-        ]
-        for tag, attrs in rating_selectors:
-            rating_elem = soup.find(tag, attrs=attrs)
+        for selector in _FLIPKART_RATING_SELS:
+            rating_elem = selector.select_one(soup)
             if rating_elem:
                 rating_text = rating_elem.get_text()
                 match = re.search(r'(\d+\.?\d*)', rating_text)
@@ -1152,28 +1573,22 @@ class FlipkartScraper(BaseProductScraper):
             if seller_link:
                 seller_name = seller_link.get_text().strip()
         
-        # Method 2: Look for seller info section
-        if not seller_name:
-            for elem in soup.find_all(['div', 'span']):
-                text = elem.get_text()
-                if 'sold by' in text.lower():
-                    sold_by_match = re.search(r'Sold by\s+([^\n]+)', text, re.IGNORECASE)
-                    if sold_by_match:
-                        seller_name = sold_by_match.group(1).strip()
-                        break
-        
-        # Method 3: Check for Flipkart Assured or Flipkart direct
-        for elem in soup.find_all(['div', 'span', 'img']):
-            if elem.get('alt') and 'flipkart assured' in elem.get('alt').lower():
-                is_fulfilled_by_platform = True
-                seller_info['assured'] = True
-                break
-            text = elem.get_text().lower()
-            if 'flipkart assured' in text or 'f-assured' in text:
-                is_fulfilled_by_platform = True
-                seller_info['assured'] = True
+        # Method 2 + 3: One scan of the page text for "Sold by <name>" and the
+        # Flipkart Assured markers, plus one lookup for the assured badge image
+        is_assured = soup.find('img', alt=_ASSURED_ALT_RE) is not None
+        for match in _SELLER_RE.finditer(page_text):
+            if match.group(1) is not None:
+                if not seller_name:
+                    seller_name = match.group(1).strip()
+            else:
+                is_assured = True
+            if seller_name and is_assured:
                 break
         
+        if is_assured:
+            is_fulfilled_by_platform = True
+            seller_info['assured'] = True
+        
         # Check if sold by Flipkart directly
         if seller_name and 'flipkart' in seller_name.lower():
             is_fulfilled_by_platform = True
@@ -1202,10 +1617,8 @@ class FlipkartScraper(BaseProductScraper):
         
         # Approach 7: Extract from page scripts/metadata
         if not mrp or not offer_price:
-            scripts = soup.find_all('script', type='application/ld+json')
-            for script in scripts:
+            for data in self._extract_json_ld_all(soup):
                 try:
-                    data = json.loads(script.string)
                     if isinstance(data, dict):
                         # Look for price information
                         if 'offers' in data:
@@ -1230,17 +1643,12 @@ class FlipkartScraper(BaseProductScraper):
         # Many Flipkart products have 20-40% discount
         if not mrp and offer_price:
             # Look for any percentage number on the page
-            all_percentages = []
-            for elem in soup.find_all(string=re.compile(r'\d+%')):
-                pct_match = re.search(r'(\d+)%', elem.strip())
-                if pct_match:
-                    pct = int(pct_match.group(1))
-                    if 5 <= pct <= 90:  # Reasonable discount range
-                        all_percentages.append(pct)
+            all_percentages = (int(m) for m in _PCT_RE.findall(page_text))
             
-            # Use the highest percentage found (likely the main discount)
-            if all_percentages:
-                discount_pct = max(all_percentages)
+            # Use the highest percentage in a reasonable discount range
+            # (likely the main discount)
+            discount_pct = max((pct for pct in all_percentages if 5 <= pct <= 90), default=None)
+            if discount_pct is not None:
                 mrp = offer_price / (1 - discount_pct / 100)
         
         # Sanity check: MRP should be >= offer_price
@@ -1270,7 +1678,7 @@ class FlipkartScraper(BaseProductScraper):
             'seller_info': seller_info if seller_info else None,
             'product_image_url': image_data.get('main_image'),
             'additional_images': image_data.get('additional_images', []),
-            'raw_html': html[:5000],
+            'raw_html': self._raw_html_snippet(html, include_raw_html),
             'error': None
         }
 
@@ -1278,13 +1686,12 @@ class FlipkartScraper(BaseProductScraper):
 class MyntraScraper(BaseProductScraper):
     """Scraper for Myntra product pages."""
     
-    def can_handle(self, url: str) -> bool:
-        """Check if URL is a Myntra product page."""
-        return 'myntra.com' in url.lower()
+    DOMAINS = ('myntra.com',)
     
-    def scrape(self, url: str) -> Dict:
+    def scrape(self, url: str, html: Optional[str] = None, include_raw_html: bool = False) -> Dict:
         """Scrape Myntra product page (Updated Dec 2025)."""
-        html = self._fetch_page(url)
+        if html is None:
+            html = self._fetch_page(url)
         
         if not html:
             return {
@@ -1293,7 +1700,7 @@ class MyntraScraper(BaseProductScraper):
                 'raw_html': None
             }
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._make_soup(html)
         
         # Extract title - Try multiple selectors (Myntra changes these frequently)
         title = None
@@ -1353,11 +1760,17 @@ class MyntraScraper(BaseProductScraper):
                 ('strong', {'class': re.compile(r'pdp.*price', re.I)}),
                 ('div', {'class': re.compile(r'pdp.*price', re.I)}),
             ]
+            # Everything inside a strikethrough is an MRP, never the offer price;
+            # collect it once instead of walking up the parents of each candidate
+            struck = set()
+            for strike_elem in soup.find_all(['s', 'del', 'strike']):
+                struck.update(id(d) for d in strike_elem.descendants)
+            
             for tag, attrs in price_selectors:
                 price_elem = soup.find(tag, attrs=attrs)
                 if price_elem:
                     price_text = price_elem.get_text()
-                    if '₹' in price_text and not price_elem.find_parent('s') and not price_elem.find_parent('del'):
+                    if '₹' in price_text and id(price_elem) not in struck:
                         offer_price = self._clean_price(price_text)
                         if offer_price:
                             break
@@ -1423,7 +1836,7 @@ class MyntraScraper(BaseProductScraper):
             'seller': 'Myntra',
             'product_image_url': image_data.get('main_image'),
             'additional_images': image_data.get('additional_images', []),
-            'raw_html': html[:5000],
+            'raw_html': self._raw_html_snippet(html, include_raw_html),
             'error': None
         }
 
@@ -1431,51 +1844,37 @@ class MyntraScraper(BaseProductScraper):
 class AjioScraper(BaseProductScraper):
     """Scraper for Ajio product pages with Selenium fallback for 403 errors."""
     
-    def can_handle(self, url: str) -> bool:
-        """Check if URL is an Ajio product page."""
-        url_lower = url.lower()
-        return 'ajio.com' in url_lower or 'ajiio.co' in url_lower
+    DOMAINS = ('ajio.com', 'ajiio.co')
+    JS_RENDERED = True
     
     def _fetch_with_selenium(self, url: str) -> Optional[str]:
         """Fetch with Selenium to bypass 403 Forbidden."""
         if not SELENIUM_AVAILABLE:
             return None
         
-        driver = None
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(20)
-            driver.get(url)
-            
-            # Wait for content
-            try:
-                WebDriverWait(driver, 8).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "h1"))
-                )
-            except:
-                time.sleep(2)
-            
-            return driver.page_source
+            with SeleniumPool.driver() as driver:
+                driver.set_page_load_timeout(20)
+                driver.get(url)
+                
+                # Wait for content
+                try:
+                    WebDriverWait(driver, 8).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "h1"))
+                    )
+                except:
+                    time.sleep(2)
+                
+                return driver.page_source
         except Exception as e:
             print(f"⚠️ Selenium fallback failed: {e}")
             return None
-        finally:
-            if driver:
-                driver.quit()
     
-    def scrape(self, url: str) -> Dict:
+    def scrape(self, url: str, html: Optional[str] = None, include_raw_html: bool = False) -> Dict:
         """Scrape Ajio product page with Selenium fallback."""
         # Try regular fetch first
-        html = self._fetch_page(url)
+        if html is None:
+            html = self._fetch_page(url)
         
         # If failed (likely 403), try Selenium
         if not html:
@@ -1489,7 +1888,10 @@ class AjioScraper(BaseProductScraper):
                 'raw_html': None
             }
         
-        soup = BeautifulSoup(html, 'html.parser')
+        if SELECTOLAX_AVAILABLE:
+            return self._scrape_with_selectolax(html, url, include_raw_html)
+        
+        soup = self._make_soup(html)
         
         # Extract title
         title = None
@@ -1514,7 +1916,7 @@ class AjioScraper(BaseProductScraper):
         discount_elem = soup.find('span', {'class': 'prod-discount'})
         if discount_elem:
             discount_text = discount_elem.get_text()
-            match = re.search(r'(\d+)', discount_text)
+            match = _INT_RE.search(discount_text)
             if match:
                 discount = int(match.group(1))
         
@@ -1531,7 +1933,67 @@ class AjioScraper(BaseProductScraper):
             'seller': 'Ajio',
             'product_image_url': image_data.get('main_image'),
             'additional_images': image_data.get('additional_images', []),
-            'raw_html': html[:5000],
+            'raw_html': self._raw_html_snippet(html, include_raw_html),
+            'error': None
+        }
+
+
+    def _scrape_with_selectolax(self, html: str, url: str, include_raw_html: bool = False) -> Dict:
+        """
+        Same extraction as scrape(), on a Lexbor tree instead of BeautifulSoup.
+        
+        Every Ajio lookup is a fixed class selector, so the whole page can be
+        handled by selectolax's C parser and CSS engine.
+        """
+        tree = LexborHTMLParser(html)
+        
+        def node_text(selector: str) -> Optional[str]:
+            node = tree.css_first(selector)
+            return node.text() if node else None
+        
+        # Extract title
+        title = node_text('h1.prod-title')
+        if title:
+            title = title.strip()
+        
+        # Extract MRP
+        mrp = None
+        mrp_text = node_text('span.prod-orginal-price')
+        if mrp_text:
+            mrp = self._clean_price(mrp_text)
+        
+        # Extract offer price
+        offer_price = None
+        price_text = node_text('span.prod-sp')
+        if price_text:
+            offer_price = self._clean_price(price_text)
+        
+        # Extract images (same order as _extract_images: site image, og:image, twitter:image)
+        main_image = None
+        for selector, attr in (
+            ('img[class*="rilrtl-lazy-img"]', 'src'),
+            ('meta[property="og:image"]', 'content'),
+            ('meta[name="twitter:image"]', 'content'),
+        ):
+            node = tree.css_first(selector)
+            img_url = node.attributes.get(attr) if node else None
+            if img_url:
+                img_url = self._clean_image_url(img_url)
+                if self._is_valid_product_image(img_url):
+                    main_image = img_url
+                    break
+        
+        return {
+            'success': True,
+            'title': title,
+            'mrp': mrp,
+            'offer_price': offer_price,
+            'availability': 'Available',
+            'rating': None,
+            'seller': 'Ajio',
+            'product_image_url': main_image,
+            'additional_images': [],
+            'raw_html': self._raw_html_snippet(html, include_raw_html),
             'error': None
         }
 
@@ -1539,48 +2001,77 @@ class AjioScraper(BaseProductScraper):
 class MeeshoScraper(BaseProductScraper):
     """Scraper for Meesho product pages with Selenium fallback for 403 errors."""
     
-    def can_handle(self, url: str) -> bool:
-        """Check if URL is a Meesho product page."""
-        return 'meesho.com' in url.lower() or 'msho.in' in url.lower()
+    DOMAINS = ('meesho.com', 'msho.in')
+    JS_RENDERED = True
     
     def _fetch_with_selenium_fallback(self, url: str) -> Optional[str]:
         """Fetch with Selenium if regular request gets 403."""
         if not SELENIUM_AVAILABLE:
             return self._fetch_page(url)
         
-        driver = None
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-            
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(20)
-            driver.get(url)
-            
-            # Wait for content
-            try:
-                WebDriverWait(driver, 8).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "h1"))
-                )
-            except:
-                time.sleep(2)
-            
-            return driver.page_source
+            with SeleniumPool.driver() as driver:
+                driver.set_page_load_timeout(20)
+                driver.get(url)
+                
+                # Wait for content
+                try:
+                    WebDriverWait(driver, 8).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "h1"))
+                    )
+                except:
+                    time.sleep(2)
+                
+                return driver.page_source
         except Exception as e:
             print(f"⚠️ Selenium fallback failed: {e}")
             return None
-        finally:
-            if driver:
-                driver.quit()
     
-    def scrape(self, url: str) -> Dict:
+    def _meesho_mrp(self, elem) -> Optional[float]:
+        """MRP from an element marked as M.R.P or holding a strikethrough."""
+        text = elem.get_text()
+        if '₹' in text and ('M.R.P' in text or 'MRP' in text.upper() or elem.find('s')):
+            return self._clean_price(text)
+        return None
+    
+    def _meesho_price(self, elem) -> Optional[float]:
+        """Offer price from an element showing a rupee amount."""
+        text = elem.get_text()
+        return self._clean_price(text) if '₹' in text else None
+    
+    @staticmethod
+    def _meesho_rating(elem) -> Optional[float]:
+        """Rating from "4.1 ★" or a bare number, if within 0-5."""
+        rating_text = elem.get_text()
+        match = _RATING_STAR_RE.search(rating_text) or _FLOAT_RE.search(rating_text)
+        if match:
+            try:
+                rating = float(match.group(1))
+            except ValueError:
+                return None
+            if rating <= 5:  # Valid rating range
+                return rating
+        return None
+    
+    def _first_visible_price(self, soup: BeautifulSoup) -> Optional[float]:
+        """
+        First price >= ₹10 in the page's text nodes.
+        
+        Script/style strings are skipped: their JSON (recommendation widgets
+        etc.) carries other products' prices.
+        """
+        for text in soup.find_all(string=_RUPEE_RE):
+            if text.parent is not None and text.parent.name in ('script', 'style'):
+                continue
+            price = self._clean_price(str(text))
+            if price and price >= 10:
+                return price
+        return None
+    
+    def scrape(self, url: str, html: Optional[str] = None, include_raw_html: bool = False) -> Dict:
         """Scrape Meesho product page with Selenium fallback for 403 errors."""
-        html = self._fetch_page(url)
+        if html is None:
+            html = self._fetch_page(url)
         
         # If 403 error or no HTML, try Selenium
         if not html or len(html) < 5000:
@@ -1594,37 +2085,15 @@ class MeeshoScraper(BaseProductScraper):
                 'raw_html': None
             }
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._make_soup(html)
         
         # Extract title
-        title = None
-        title_selectors = [
-            ('h1', {'class': 'Title__HeadingWrapper-sc-1j0fgbz-0'}),
-            ('span', {'class': 'sc-eDvSVe'}),
-            ('h1', {}),
-        ]
-        for tag, attrs in title_selectors:
-            title_elem = soup.find(tag, attrs=attrs)
-            if title_elem:
-                title = title_elem.get_text().strip()
-                break
+        title = self._first_match(soup, _MEESHO_TITLE_SELS, lambda elem: elem.get_text().strip())
         
         # Extract MRP (original price)
-        mrp = None
-        mrp_selectors = [
-            ('p', {'class': 'sc-eDvSVe'}),
-            ('span', {'class': 'Text-sc-16kzopp-0'}),
-        ]
-        for tag, attrs in mrp_selectors:
-            all_prices = soup.find_all(tag, attrs)
-            for elem in all_prices:
-                text = elem.get_text()
-                if '₹' in text and ('M.R.P' in text or 'MRP' in text.upper() or elem.find('s')):
-                    mrp = self._clean_price(text)
-                    if mrp:
-                        break
-            if mrp:
-                break
+        # Every candidate is checked here: the MRP is whichever one carries
+        # an M.R.P label or a strikethrough
+        mrp = self._first_match(soup, _MEESHO_MRP_SELS, self._meesho_mrp, all_matches=True)
         
         # Fallback: look for strikethrough price
         if not mrp:
@@ -1633,49 +2102,14 @@ class MeeshoScraper(BaseProductScraper):
                 mrp = self._clean_price(strikethrough.get_text())
         
         # Extract offer price (current price)
-        offer_price = None
-        price_selectors = [
-            ('h4', {'class': 'Price__BaseText-sc-w7bcyz-0'}),
-            ('span', {'class': 'sc-eDvSVe'}),
-        ]
-        for tag, attrs in price_selectors:
-            price_elem = soup.find(tag, attrs=attrs)
-            if price_elem:
-                text = price_elem.get_text()
-                if '₹' in text:
-                    offer_price = self._clean_price(text)
-                    if offer_price:
-                        break
+        offer_price = self._first_match(soup, _MEESHO_PRICE_SELS, self._meesho_price)
         
         # Fallback: find any large price text
         if not offer_price:
-            all_text = soup.find_all(text=re.compile(r'₹\s*\d+'))
-            for text in all_text:
-                price = self._clean_price(str(text))
-                if price and price >= 10:
-                    offer_price = price
-                    break
+            offer_price = self._first_visible_price(soup)
         
         # Extract rating
-        rating = None
-        rating_selectors = [
-            ('p', {'class': 'sc-eDvSVe'}),
-            ('span', {'class': 'Rating__BaseText-sc-1dcnzc3-0'}),
-        ]
-        for tag, attrs in rating_selectors:
-            rating_elem = soup.find(tag, attrs=attrs)
-            if rating_elem:
-                rating_text = rating_elem.get_text()
-                match = re.search(r'(\d+\.?\d*)\s*★', rating_text)
-                if not match:
-                    match = re.search(r'(\d+\.?\d*)', rating_text)
-                if match:
-                    try:
-                        rating = float(match.group(1))
-                        if rating <= 5:  # Valid rating range
-                            break
-                    except ValueError:
-                        pass
+        rating = self._first_match(soup, _MEESHO_RATING_SELS, self._meesho_rating)
         
         # Extract images
         image_data = self._extract_images(soup, url)
@@ -1690,7 +2124,7 @@ class MeeshoScraper(BaseProductScraper):
             'seller': 'Meesho',
             'product_image_url': image_data.get('main_image'),
             'additional_images': image_data.get('additional_images', []),
-            'raw_html': html[:5000],
+            'raw_html': self._raw_html_snippet(html, include_raw_html),
             'error': None
         }
 
@@ -1700,9 +2134,11 @@ class MeeshoScraper(BaseProductScraper):
 class ShopsyScraper(BaseProductScraper):
     """Scraper for Shopsy product pages (Flipkart's budget platform using JavaScript rendering)."""
     
-    def can_handle(self, url: str) -> bool:
-        """Check if URL is a Shopsy product page."""
-        return 'shopsy.in' in url.lower()
+    DOMAINS = ('shopsy.in',)
+    JS_RENDERED = True
+    
+    # Plain HTTP only returns the JS shell when Selenium can render instead
+    ASYNC_PREFETCH = not SELENIUM_AVAILABLE
     
     def _fetch_with_selenium(self, url: str) -> Optional[str]:
         """Fetch page using Selenium for JavaScript rendering."""
@@ -1710,53 +2146,60 @@ class ShopsyScraper(BaseProductScraper):
             print("⚠️ Selenium not available, falling back to requests")
             return self._fetch_page(url)
         
-        driver = None
         try:
-            # Setup Chrome options
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            # Initialize driver
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(30)
-            
-            # Load page
-            driver.get(url)
-            
-            # Wait for price element to load (max 10 seconds)
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='price'], span[class*='price'], div[class*='Price']"))
-                )
-            except:
-                # If price doesn't load, wait a bit anyway
-                time.sleep(3)
-            
-            # Get rendered HTML
-            html = driver.page_source
-            return html
-            
+            with SeleniumPool.driver() as driver:
+                driver.set_page_load_timeout(30)
+                
+                # Load page
+                driver.get(url)
+                
+                # Wait for price element to load (max 10 seconds)
+                try:
+                    WebDriverWait(driver, 10).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='price'], span[class*='price'], div[class*='Price']"))
+                    )
+                except:
+                    # If price doesn't load, wait a bit anyway
+                    time.sleep(3)
+                
+                # Get rendered HTML
+                html = driver.page_source
+                return html
+                
         except Exception as e:
             print(f"❌ Selenium error: {e}")
             return None
-        finally:
-            if driver:
-                driver.quit()
     
-    def scrape(self, url: str) -> Dict:
+    @staticmethod
+    def _shopsy_rating(elem) -> Optional[float]:
+        """Rating from the first number in the element's text."""
+        match = _FLOAT_RE.search(elem.get_text())
+        return float(match.group(1)) if match else None
+    
+    @staticmethod
+    def _rupee_texts(soup: BeautifulSoup) -> List:
+        """
+        Collect every text node containing ₹ from the already-parsed page,
+        so both price fallbacks share one walk of the tree.
+        
+        Returns:
+            List of (text, parent tag name, parent holds only this text) tuples
+        """
+        return [
+            (str(text), text.parent.name if text.parent else None,
+             text.parent is not None and text.parent.string is not None)
+            for text in soup.find_all(string=_RUPEE_RE)
+        ]
+    
+    def scrape(self, url: str, html: Optional[str] = None, include_raw_html: bool = False) -> Dict:
         """Scrape Shopsy product page (uses JavaScript rendering)."""
         # Try Selenium first if available
-        if SELENIUM_AVAILABLE:
-            html = self._fetch_with_selenium(url)
-        else:
-            # Fallback to regular requests (may not work for all products)
-            html = self._fetch_page(url)
+        if html is None:
+            if SELENIUM_AVAILABLE:
+                html = self._fetch_with_selenium(url)
+            else:
+                # Fallback to regular requests (may not work for all products)
+                html = self._fetch_page(url)
         
         if not html:
             # If both methods fail, return partial success to avoid rejection
@@ -1774,13 +2217,21 @@ class ShopsyScraper(BaseProductScraper):
                 'raw_html': None
             }
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._make_soup(html)
+        
+        # Collect __NEXT_DATA__ and JSON-LD scripts in a single DOM walk
+        next_data_script = None
+        json_ld_scripts = []
+        for script_tag in _SHOPSY_DATA_SCRIPTS_SEL.select(soup):
+            if script_tag.get('id') == '__NEXT_DATA__':
+                next_data_script = next_data_script or script_tag
+            else:
+                json_ld_scripts.append(script_tag)
         
         # Check for __NEXT_DATA__ and 404 errors
-        next_data_script = soup.find('script', id='__NEXT_DATA__')
         if next_data_script and next_data_script.string:
             try:
-                data = json.loads(next_data_script.string)
+                data = _json_loads(next_data_script.string)
                 page_props = data.get('props', {}).get('pageProps', {})
                 
                 # Check for 404 error
@@ -1818,7 +2269,7 @@ class ShopsyScraper(BaseProductScraper):
                         'seller': 'Shopsy',
                         'product_image_url': image_data.get('main_image'),
                         'additional_images': image_data.get('additional_images', []),
-                        'raw_html': html[:5000],
+                        'raw_html': self._raw_html_snippet(html, include_raw_html),
                         'error': None
                     }
             except:
@@ -1833,7 +2284,8 @@ class ShopsyScraper(BaseProductScraper):
         
         # Try JSON-LD first (most reliable for Shopsy/Flipkart)
         try:
-            json_ld = self._extract_json_ld(soup)
+            json_ld_blocks = self._extract_json_ld_all(soup, json_ld_scripts)
+            json_ld = json_ld_blocks[0] if json_ld_blocks else None
             if json_ld:
                 if 'name' in json_ld:
                     title = json_ld['name']
@@ -1853,35 +2305,20 @@ class ShopsyScraper(BaseProductScraper):
         
         # Extract title - Similar to Flipkart structure
         if not title:
-            title_selectors = [
-                ('span', {'class': 'VU-ZEz'}),
-                ('h1', {'class': 'yhB1nd'}),
-                ('span', {'class': 'B_NuCI'}),
-                ('h1', {'class': '_6EBuvT'}),
-                ('span', {'class': re.compile(r'.*title.*', re.I)}),
-                ('h1', {}),
-            ]
-            for tag, attrs in title_selectors:
-                title_elem = soup.find(tag, attrs=attrs if attrs else None)
-                if title_elem:
-                    title = title_elem.get_text().strip()
-                    if title:
-                        break
+            # Known title classes in priority order, then the generic fallbacks
+            title = self._first_match(soup, _SHOPSY_TITLE_SELS, lambda elem: elem.get_text().strip())
+            
+            if not title:
+                for tag, attrs in (('span', {'class': _TITLE_CLASS_RE}), ('h1', None)):
+                    title_elem = soup.find(tag, attrs=attrs)
+                    if title_elem:
+                        title = title_elem.get_text().strip()
+                        if title:
+                            break
         
         # Extract MRP (original price)
         if not mrp:
-            mrp_selectors = [
-                ('div', {'class': '_3I9_wc _27UcVY'}),
-                ('div', {'class': '_3auQ3N _1POkHg'}),
-                ('div', {'class': 'yRaY8j A6+E6v'}),
-                ('div', {'class': '_3I9_wc _2p6lqe'}),
-            ]
-            for tag, attrs in mrp_selectors:
-                mrp_elem = soup.find(tag, attrs=attrs)
-                if mrp_elem:
-                    mrp = self._clean_price(mrp_elem.get_text())
-                    if mrp:
-                        break
+            mrp = self._first_match(soup, _SHOPSY_MRP_SELS, lambda elem: self._clean_price(elem.get_text()))
             
             # Fallback: Find strikethrough prices
             if not mrp:
@@ -1892,28 +2329,20 @@ class ShopsyScraper(BaseProductScraper):
                         if mrp:
                             break
         
+        # ₹ text nodes, collected on first use by the price fallbacks
+        rupee_texts = None
+        
         # Extract offer price (current price)
         if not offer_price:
-            price_selectors = [
-                ('div', {'class': '_30jeq3 _16Jk6d'}),
-                ('div', {'class': '_30jeq3'}),
-                ('div', {'class': '_3qQ9m1'}),
-                ('div', {'class': 'Nx9bqj CxhGGd'}),
-                ('div', {'class': '_25b18c'}),
-                ('span', {'class': 'Nx9bqj'}),
-            ]
-            for tag, attrs in price_selectors:
-                price_elem = soup.find(tag, attrs=attrs)
-                if price_elem:
-                    offer_price = self._clean_price(price_elem.get_text())
-                    if offer_price:
-                        break
+            offer_price = self._first_match(
+                soup, _SHOPSY_PRICE_SELS, lambda elem: self._clean_price(elem.get_text())
+            )
             
-            # Fallback: Search for prices
+            # Fallback: Search for prices (div/span whose only content is a ₹ price)
             if not offer_price:
-                for elem in soup.find_all(['div', 'span'], string=re.compile(r'₹\s*\d+')):
-                    text = elem.get_text()
-                    if '₹' in text and 'off' not in text.lower():
+                rupee_texts = self._rupee_texts(soup)
+                for text, parent_tag, is_only_text in rupee_texts:
+                    if is_only_text and parent_tag in ('div', 'span') and 'off' not in text.lower():
                         price = self._clean_price(text)
                         if price and price > 10:
                             offer_price = price
@@ -1921,11 +2350,12 @@ class ShopsyScraper(BaseProductScraper):
         
         # If still no offer_price, try finding all prices
         if not offer_price:
+            if rupee_texts is None:
+                rupee_texts = self._rupee_texts(soup)
             all_prices = []
-            for elem in soup.find_all(text=re.compile(r'₹\s*\d+')):
-                parent = elem.parent
-                if parent and parent.name not in ['script', 'style', 's', 'del']:
-                    price = self._clean_price(str(elem))
+            for text, parent_tag, _ in rupee_texts:
+                if parent_tag not in ('script', 'style', 's', 'del'):
+                    price = self._clean_price(text)
                     if price and price > 10:
                         all_prices.append(price)
             
@@ -1937,18 +2367,7 @@ class ShopsyScraper(BaseProductScraper):
         
         # Extract rating if not from JSON-LD
         if not rating:
-            rating_selectors = [
-                ('div', {'class': '_3LWZlK'}),
-                ('div', {'class': 'XQDdHH'}),
-            ]
-            for tag, attrs in rating_selectors:
-                rating_elem = soup.find(tag, attrs=attrs)
-                if rating_elem:
-                    rating_text = rating_elem.get_text()
-                    match = re.search(r'(\d+\.?\d*)', rating_text)
-                    if match:
-                        rating = float(match.group(1))
-                        break
+            rating = self._first_match(soup, _SHOPSY_RATING_SELS, self._shopsy_rating)
         
         # Extract images
         image_data = self._extract_images(soup, url)
@@ -1963,7 +2382,7 @@ class ShopsyScraper(BaseProductScraper):
             'seller': 'Shopsy',
             'product_image_url': image_data.get('main_image'),
             'additional_images': image_data.get('additional_images', []),
-            'raw_html': html[:5000],
+            'raw_html': self._raw_html_snippet(html, include_raw_html),
             'error': None
         }
 
@@ -1973,16 +2392,30 @@ class ProductScraperFactory:
     Factory class to get the appropriate scraper for a given URL.
     """
     
-    def __init__(self):
-        """Initialize factory with all available scrapers."""
-        self.scrapers = [
-            AmazonScraper(),
-            FlipkartScraper(),
-            MyntraScraper(),
-            MeeshoScraper(),
-            AjioScraper(),
-            ShopsyScraper(),
-        ]
+    def __init__(self, use_cache: bool = False):
+        """
+        Initialize factory with all available scrapers.
+        
+        Args:
+            use_cache: Give the scrapers the on-disk page cache. Off by default:
+                verification needs live prices and stock.
+        """
+        scraper_classes = (
+            AmazonScraper,
+            FlipkartScraper,
+            MyntraScraper,
+            MeeshoScraper,
+            AjioScraper,
+            ShopsyScraper,
+        )
+        self.scrapers = [cls(use_cache=use_cache) for cls in scraper_classes]
+        
+        # Domain -> scraper, built from each scraper's DOMAINS
+        self._host_map = {
+            domain: scraper
+            for scraper in self.scrapers
+            for domain in scraper.DOMAINS
+        }
     
     def get_scraper(self, url: str) -> Optional[BaseProductScraper]:
         """
@@ -1994,17 +2427,38 @@ class ProductScraperFactory:
         Returns:
             Scraper instance or None if no scraper available
         """
+        parsed = urlparse(url)
+        host = parsed.hostname
+        if host:
+            if host.startswith('www.'):
+                host = host[4:]
+            scraper = self._host_map.get(host)
+            if scraper:
+                return scraper
+            # Subdomains (dl.flipkart.com, m.meesho.com, ...); the dot keeps
+            # look-alikes such as notflipkart.com out
+            for domain, scraper in self._host_map.items():
+                if host.endswith('.' + domain):
+                    return scraper
+            # Unknown host: affiliate/redirect links carry the store URL in the
+            # path or query, so look there (but not at the host itself)
+            url_lower = f"{parsed.path}?{parsed.query}#{parsed.fragment}".lower()
+        else:
+            # No scheme/host (e.g. "flipkart.com/..."): match anywhere in the URL
+            url_lower = url.lower()
+        
         for scraper in self.scrapers:
-            if scraper.can_handle(url):
+            if scraper.can_handle_lower(url_lower):
                 return scraper
         return None
     
-    def scrape_product(self, url: str) -> Dict:
+    def scrape_product(self, url: str, include_raw_html: bool = False) -> Dict:
         """
         Scrape product data using the appropriate scraper.
         
         Args:
             url: Product URL
+            include_raw_html: Include the start of the HTML (<= 4 KB) as 'raw_html'
             
         Returns:
             Dict containing product data or error
@@ -2018,12 +2472,116 @@ class ProductScraperFactory:
                 'url': url
             }
         
-        result = scraper.scrape(url)
+        result = scraper.scrape(url, include_raw_html=include_raw_html)
         result['url'] = url
         result['domain'] = urlparse(url).netloc
         
         return result
-
+    
+    async def scrape_products_async(self, urls: List[str], max_concurrency: int = 8) -> List[Dict]:
+        """
+        Scrape several product URLs concurrently.
+        
+        Pages are fetched over one shared aiohttp session when aiohttp is
+        installed; otherwise each scrape runs in a worker thread.
+        
+        Args:
+            urls: Product URLs
+            max_concurrency: Maximum scrapes in flight at once
+            
+        Returns:
+            List of result dicts, in the same order as urls
+        """
+        return await self._scrape_concurrently(urls, max_concurrency)
+    
+    async def scrape_product_batch(self, urls: List[str], max_concurrency: int = 5) -> List[Dict]:
+        """
+        Scrape several product URLs, rendering JS-heavy sites with Playwright.
+        
+        One headless Chromium is shared by the whole batch, with a fresh
+        context per URL, instead of one Selenium Chrome per fallback. Sites
+        that don't need rendering go through scrape_products_async as usual.
+        
+        Args:
+            urls: Product URLs
+            max_concurrency: Maximum scrapes/pages in flight at once
+            
+        Returns:
+            List of result dicts, in the same order as urls
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            return await self._scrape_concurrently(urls, max_concurrency)
+        
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True)
+            
+            async def render(url: str) -> Optional[str]:
+                context = await browser.new_context(user_agent=SeleniumPool.USER_AGENT)
+                try:
+                    page = await context.new_page()
+                    await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                    return await page.content()
+                except Exception as e:
+                    print(f"⚠️ Playwright render failed for {url}: {e}")
+                    return None
+                finally:
+                    await context.close()
+            
+            try:
+                return await self._scrape_concurrently(urls, max_concurrency, render)
+            finally:
+                await browser.close()
+    
+    async def _scrape_concurrently(self, urls: List[str], max_concurrency: int, render=None) -> List[Dict]:
+        """
+        Run scrapes for urls under a concurrency cap.
+        
+        Args:
+            urls: Product URLs
+            max_concurrency: Maximum scrapes in flight at once
+            render: Optional coroutine url -> html used for JS_RENDERED scrapers
+            
+        Returns:
+            List of result dicts, in the same order as urls
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _scrape_one(url: str, session) -> Dict:
+            scraper = self.get_scraper(url)
+            if not scraper:
+                return {
+                    'success': False,
+                    'error': 'No scraper available for this URL',
+                    'url': url
+                }
+            
+            async with semaphore:
+                try:
+                    if render is not None and scraper.JS_RENDERED:
+                        # A failed render passes None and the scraper fetches as usual
+                        html = await render(url)
+                        result = await asyncio.to_thread(scraper.scrape, url, html)
+                    else:
+                        result = await scraper.scrape_async(url, session)
+                except Exception as e:
+                    result = {'success': False, 'error': str(e)}
+            
+            result['url'] = url
+            result['domain'] = urlparse(url).netloc
+            return result
+        
+        try:
+            if not AIOHTTP_AVAILABLE:
+                return await asyncio.gather(*(_scrape_one(url, None) for url in urls))
+            
+            # Reuse the requests headers; let aiohttp negotiate Accept-Encoding
+            headers = {k: v for k, v in self.scrapers[0].session.headers.items()
+                       if k.lower() != 'accept-encoding'}
+            async with aiohttp.ClientSession(headers=headers) as session:
+                return await asyncio.gather(*(_scrape_one(url, session) for url in urls))
+        finally:
+            # The batch's Selenium fallbacks are done; don't leave Chromes idling
+            await asyncio.to_thread(SeleniumPool.close_idle)
 
 # Example usage
 if __name__ == "__main__":
@@ -3,11 +3,15 @@ Daily Deals Scheduler
 Runs scrapers periodically and stores data in Supabase
 """
 
+import asyncio
+import functools
 import logging
 from datetime import datetime, time
-from typing import Dict
+from typing import Dict, Iterable, Iterator, List
+from itertools import islice
 import os
-from apscheduler.schedulers.blocking import BlockingScheduler
+from concurrent.futures import ThreadPoolExecutor
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
 
@@ -21,6 +25,7 @@ from scrapers import (
     scrape_reliance_digital_deals
 )
 from database import get_db_client
+from utils.browser_helper import BrowserHelper
 
 logging.basicConfig(
     level=logging.INFO,
@@ -29,15 +34,30 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _batched(items: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """Yield lists of up to `size` items (itertools.batched is 3.12+ only)"""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
 class DailyDealsScheduler:
     """Scheduler for running daily deals scrapers"""
     
+    # Sites rendered with a headless browser (their scrapers accept browser=)
+    BROWSER_SITES = ('myntra', 'ajio', 'meesho')
+    
     def __init__(self):
         self.db = get_db_client()
-        self.scheduler = BlockingScheduler(timezone=pytz.timezone('Asia/Kolkata'))
+        self.scheduler = AsyncIOScheduler(timezone=pytz.timezone('Asia/Kolkata'))
         
         # Configuration
         self.max_deals_per_site = int(os.getenv('MAX_DEALS_PER_SITE', 50))
+        self.upsert_batch_size = int(os.getenv('UPSERT_BATCH_SIZE', 10))
+        self.share_browser = os.getenv('SHARE_BROWSER', 'true').lower() == 'true'
         
         # Scraper mapping
         self.scrapers = {
@@ -66,19 +86,23 @@ class DailyDealsScheduler:
         logger.info(f"{'='*60}")
         
         try:
-            # Run scraper
+            # Run scraper (a list or a generator of deals)
             deals = scraper_func(max_deals=self.max_deals_per_site)
             
-            if not deals:
-                logger.warning(f"No deals found for {website}")
-                return {'website': website, 'success': 0, 'failed': 0, 'total': 0}
+            # Store in database in small batches, so a generator scraper's
+            # deals are written as they arrive instead of all at the end
+            results = {'website': website, 'success': 0, 'failed': 0, 'total': 0}
+            for batch in _batched(deals or [], self.upsert_batch_size):
+                batch_results = self.db.upsert_deals_bulk(website, batch)
+                results['success'] += batch_results['success']
+                results['failed'] += batch_results['failed']
+                results['total'] += len(batch)
             
-            # Store in database
-            results = self.db.upsert_deals_bulk(website, deals)
+            if not results['total']:
+                logger.warning(f"No deals found for {website}")
+                return results
             
             logger.info(f"✓ Completed {website}: {results['success']} deals stored")
-            results['website'] = website
-            results['total'] = len(deals)
             
             return results
             
@@ -86,21 +110,62 @@ class DailyDealsScheduler:
             logger.error(f"✗ Error processing {website}: {e}")
             return {'website': website, 'success': 0, 'failed': 0, 'total': 0, 'error': str(e)}
     
-    def run_all_scrapers(self):
-        """Run all scrapers sequentially"""
+    def scrape_browser_sites(self, websites: List[str]) -> List[Dict]:
+        """
+        Run the browser-based scrapers one after another on a single browser
+        
+        Args:
+            websites: Websites from BROWSER_SITES to scrape
+            
+        Returns:
+            List of per-website results
+        """
+        try:
+            with BrowserHelper() as browser:
+                return [
+                    self.scrape_and_store(website, functools.partial(self.scrapers[website], browser=browser))
+                    for website in websites
+                ]
+        except Exception as e:
+            logger.error(f"✗ Error running browser scrapers: {e}")
+            return [{'website': website, 'success': 0, 'failed': 0, 'total': 0, 'error': str(e)}
+                    for website in websites]
+    
+    async def run_all_scrapers_async(self):
+        """Run all scrapers in parallel (one worker thread per website)"""
         logger.info("\n" + "="*60)
         logger.info("🚀 DAILY DEALS SCRAPING JOB STARTED")
         logger.info(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("="*60 + "\n")
         
-        results = []
+        # Browser sites share one headless browser (one cold start, one
+        # process) on a single worker; Playwright's sync API can't be shared
+        # across threads, so they run one after another there
+        browser_sites = [w for w in self.scrapers if w in self.BROWSER_SITES] if self.share_browser else []
+        
+        # Each site is a different domain with no shared state, so run them
+        # side by side without blocking the event loop
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=len(self.scrapers)) as executor:
+            jobs = [
+                loop.run_in_executor(executor, self.scrape_and_store, website, scraper_func)
+                for website, scraper_func in self.scrapers.items()
+                if website not in browser_sites
+            ]
+            if browser_sites:
+                jobs.append(loop.run_in_executor(executor, self.scrape_browser_sites, browser_sites))
+            results = await asyncio.gather(*jobs)
         
-        for website, scraper_func in self.scrapers.items():
-            result = self.scrape_and_store(website, scraper_func)
-            results.append(result)
+        if browser_sites:
+            results = results[:-1] + results[-1]
         
-        # Print summary
-        self._print_summary(results)
+        # Print summary in the configured site order
+        by_website = {r['website']: r for r in results}
+        self._print_summary([by_website[website] for website in self.scrapers])
+    
+    def run_all_scrapers(self):
+        """Run all scrapers once, outside the scheduler"""
+        asyncio.run(self.run_all_scrapers_async())
     
     def _print_summary(self, results: list):
         """Print job summary"""
@@ -156,7 +221,7 @@ class DailyDealsScheduler:
         
         # Schedule daily job
         self.scheduler.add_job(
-            self.run_all_scrapers,
+            self.run_all_scrapers_async,
             CronTrigger(hour=hour, minute=minute),
             id='daily_deals_job',
             name='Daily Deals Scraping Job',
@@ -165,8 +230,10 @@ class DailyDealsScheduler:
         
         logger.info("Scheduler started. Press Ctrl+C to exit.")
         
+        # AsyncIOScheduler runs jobs on the event loop, so keep the loop alive
+        self.scheduler.start()
         try:
-            self.scheduler.start()
+            asyncio.get_event_loop().run_forever()
         except (KeyboardInterrupt, SystemExit):
             logger.info("Scheduler stopped by user")
             self.scheduler.shutdown()
@@ -12,16 +12,84 @@ Date: December 2025
 """
 
 from typing import Dict, Optional, List
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
+import soupsieve as sv
 import re
 
 
+# Host label -> platform (amazon.in, dl.flipkart.com, www.myntra.com, ...)
+_PLATFORMS = {
+    'amazon': 'amazon',
+    'flipkart': 'flipkart',
+    'myntra': 'myntra',
+    'ajio': 'ajio',
+    'meesho': 'meesho',
+}
+
+# Patterns compiled once at import; used on every product page
+_AMZ_ONLY_N_LEFT = re.compile(r'only\s+(\d+)\s+left')
+_SOLD_OUT = re.compile('Sold Out|Out of Stock', re.I)
+
+# Stock phrases as one alternation per detector, so each text is scanned once
+# and the hit is classified by group name (out > low > high)
+_AMZ_STOCK = re.compile(
+    r'(?P<out>out of stock|unavailable)'
+    r'|(?P<low>left in stock|limited stock|only)'
+    r'|(?P<high>in stock|available)'
+)
+_FK_STOCK = re.compile(r'(?P<out>out of stock|sold out)|(?P<low>hurry, only|few left)', re.I)
+# Text inside these is never shown on the page (e.g. __INITIAL_STATE__ JSON)
+_INVISIBLE_TAGS = frozenset(('script', 'style', 'template', 'noscript'))
+# "only ... left" is the old only.*left check; as a lookahead it doesn't
+# consume the text in between, which may hold an out-of-stock phrase
+_GENERIC_STOCK = re.compile(
+    r'(?P<out>out of stock|sold out|unavailable|not available)'
+    r'|(?P<low>limited stock|low stock|hurry|few left|only(?=.*?left))'
+)
+# Offer blocks by class substring (case-insensitive CSS, no regex per element)
+_AMZ_OFFER_SPANS = sv.compile('span[class*="promo" i], span[class*="offer" i]')
+_FK_OFFER_DIVS = sv.compile('div[class*="offer" i], div[class*="promo" i]')
+
+# Offer keywords shared by the extractors. Plain substrings, as before:
+# banners run names together ("SBIcard", "HDFCBank")
+_BANK_OR_CARD = re.compile('bank|card', re.I)
+_EXCHANGE = re.compile('exchange', re.I)
+_EXCHANGE_OFFER = 'exchange offer'
+_NO_COST_EMI = 'no cost emi'
+_BANK_OFFER = re.compile('bank.*offer|card.*offer|cashback', re.I)
+_PCT_DISCOUNT = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+_FLAT_RS = re.compile(r'₹\s*(\d+(?:,\d+)*(?:\.\d+)?)')
+_FLAT_N = re.compile(r'flat\s+(\d+)', re.I)
+_DROP_SEPARATORS = str.maketrans('', '', ', \xa0')
+
+# <script>/<style> blocks (JSON-LD, analytics, A/B configs) often contain
+# "unavailable", "offer", "exchange" inside JSON strings
+_SCRIPT_STYLE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.I | re.S)
+
+
 class StockAvailabilityDetector:
     """Detect stock availability from product pages."""
     
     @staticmethod
-    def detect_amazon(soup: BeautifulSoup, html: str) -> Dict:
-        """Detect stock status on Amazon."""
+    def _stock_hits(pattern: re.Pattern, text: str) -> set:
+        """Names of the stock groups that match anywhere in text (one scan)."""
+        hits = set()
+        for match in pattern.finditer(text):
+            hits.add(match.lastgroup)
+            if len(hits) == pattern.groups:
+                break
+        return hits
+    
+    @staticmethod
+    def _message_for(text) -> str:
+        """Text of the div holding a matched string (the string itself if none)."""
+        container = text.find_parent('div')
+        return (container.get_text() if container else str(text)).strip()
+    
+    @staticmethod
+    def detect_amazon(soup: BeautifulSoup, html: str, html_lower: Optional[str] = None) -> Dict:
+        """Detect stock status on Amazon (html_lower: html.lower(), if already built)."""
         status = {
             'in_stock': True,
             'stock_level': 'unknown',  # 'high', 'medium', 'low', 'out', 'unknown'
@@ -32,34 +100,37 @@ class StockAvailabilityDetector:
         avail_elem = soup.find('div', {'id': 'availability'})
         if avail_elem:
             avail_text = avail_elem.get_text().lower()
+            hits = StockAvailabilityDetector._stock_hits(_AMZ_STOCK, avail_text)
             
             # Out of stock indicators
-            if any(x in avail_text for x in ['out of stock', 'unavailable', 'currently unavailable']):
+            if 'out' in hits:
                 status['in_stock'] = False
                 status['stock_level'] = 'out'
                 status['stock_message'] = avail_elem.get_text().strip()
             
             # Low stock indicators
-            elif any(x in avail_text for x in ['only', 'left in stock', 'limited stock']):
+            elif 'low' in hits:
                 status['in_stock'] = True
                 status['stock_level'] = 'low'
                 status['stock_message'] = avail_elem.get_text().strip()
                 
                 # Extract number if available
-                match = re.search(r'only\s+(\d+)\s+left', avail_text)
+                match = _AMZ_ONLY_N_LEFT.search(avail_text)
                 if match:
                     count = int(match.group(1))
                     if count <= 2:
                         status['stock_level'] = 'very_low'
             
             # In stock
-            elif any(x in avail_text for x in ['in stock', 'available']):
+            elif 'high' in hits:
                 status['in_stock'] = True
                 status['stock_level'] = 'high'
                 status['stock_message'] = avail_elem.get_text().strip()
         
         # Check for "Currently unavailable" message
-        if 'Currently unavailable' in html or 'currently unavailable' in html:
+        if html_lower is None:
+            html_lower = html.lower()
+        if 'currently unavailable' in html_lower:
             status['in_stock'] = False
             status['stock_level'] = 'out'
         
@@ -75,23 +146,32 @@ class StockAvailabilityDetector:
         }
         
         # Check for out of stock button
-        button = soup.find('button', string=re.compile('Sold Out|Out of Stock', re.I))
+        button = soup.find('button', string=_SOLD_OUT)
         if button:
             status['in_stock'] = False
             status['stock_level'] = 'out'
             status['stock_message'] = 'Sold Out'
             return status
         
-        # Check availability div
-        for div in soup.find_all('div'):
-            text = div.get_text().lower()
-            if 'out of stock' in text or 'sold out' in text:
+        # Check availability text: only the text nodes holding a stock phrase
+        # are visited, instead of serialising every div on the page. Script
+        # data can mention other variants' stock, so only visible text counts
+        low_text = None
+        for text in soup.find_all(string=_FK_STOCK):
+            if text.parent is not None and text.parent.name in _INVISIBLE_TAGS:
+                continue
+            hits = StockAvailabilityDetector._stock_hits(_FK_STOCK, text)
+            if 'out' in hits:
                 status['in_stock'] = False
                 status['stock_level'] = 'out'
-                status['stock_message'] = div.get_text().strip()
-            elif 'hurry, only' in text or 'few left' in text:
-                status['stock_level'] = 'low'
-                status['stock_message'] = div.get_text().strip()
+                status['stock_message'] = StockAvailabilityDetector._message_for(text)
+                return status
+            if low_text is None:
+                low_text = text
+        
+        if low_text is not None:
+            status['stock_level'] = 'low'
+            status['stock_message'] = StockAvailabilityDetector._message_for(low_text)
         
         return status
     
@@ -105,7 +185,7 @@ class StockAvailabilityDetector:
         }
         
         # Myntra shows "SOLD OUT" badge
-        sold_out = soup.find(string=re.compile('SOLD OUT|Out of Stock', re.I))
+        sold_out = soup.find(string=_SOLD_OUT)
         if sold_out:
             status['in_stock'] = False
             status['stock_level'] = 'out'
@@ -114,25 +194,25 @@ class StockAvailabilityDetector:
         return status
     
     @staticmethod
-    def detect_generic(soup: BeautifulSoup, html: str) -> Dict:
-        """Generic stock detection for unknown sites."""
+    def detect_generic(soup: BeautifulSoup, html: str, html_lower: Optional[str] = None) -> Dict:
+        """Generic stock detection for unknown sites (html_lower: html.lower(), if already built)."""
         status = {
             'in_stock': True,
             'stock_level': 'unknown',
             'stock_message': None
         }
         
-        text_lower = html.lower()
-        
-        # Out of stock patterns
-        out_patterns = ['out of stock', 'sold out', 'unavailable', 'not available']
-        if any(pattern in text_lower for pattern in out_patterns):
-            status['in_stock'] = False
-            status['stock_level'] = 'out'
+        if html_lower is None:
+            html_lower = html.lower()
         
-        # Low stock patterns
-        low_patterns = ['limited stock', 'low stock', 'hurry', 'few left', 'only.*left']
-        if any(re.search(pattern, text_lower) for pattern in low_patterns):
+        for match in _GENERIC_STOCK.finditer(html_lower):
+            # Out of stock settles it; no need to look for low-stock hints
+            if match.lastgroup == 'out':
+                status['in_stock'] = False
+                status['stock_level'] = 'out'
+                return status
+            
+            # Low stock: keep scanning in case the page also says out of stock
             status['stock_level'] = 'low'
         
         return status
@@ -142,8 +222,8 @@ class CouponOfferExtractor:
     """Extract coupon and bank offer details."""
     
     @staticmethod
-    def extract_amazon(soup: BeautifulSoup) -> Dict:
-        """Extract coupons and offers from Amazon."""
+    def extract_amazon(soup: BeautifulSoup, page_text: Optional[str] = None) -> Dict:
+        """Extract coupons and offers from Amazon (page_text: lowercased page HTML or text, if already built)."""
         offers = {
             'coupons': [],
             'bank_offers': [],
@@ -151,6 +231,9 @@ class CouponOfferExtractor:
             'no_cost_emi': False
         }
         
+        if page_text is None:
+            page_text = soup.get_text().lower()
+        
         # Extract coupons
         coupon_elem = soup.find('span', {'id': 'couponBadge'})
         if not coupon_elem:
@@ -160,25 +243,26 @@ class CouponOfferExtractor:
             if coupon_text:
                 offers['coupons'].append(coupon_text)
         
-        # Extract bank offers
+        # Extract bank offers (set mirrors the list for O(1) dedup)
+        seen = set()
         promo_section = soup.find('div', {'id': 'promoPriceBlockMessage_feature_div'})
         if promo_section:
             for li in promo_section.find_all('li'):
                 offer_text = li.get_text().strip()
-                if offer_text:
-                    if 'bank' in offer_text.lower() or 'card' in offer_text.lower():
-                        offers['bank_offers'].append(offer_text)
+                if offer_text and _BANK_OR_CARD.search(offer_text):
+                    offers['bank_offers'].append(offer_text)
+                    seen.add(offer_text)
         
         # Alternative: Look for offer messages
-        for span in soup.find_all('span', class_=re.compile('.*promo.*|.*offer.*', re.I)):
+        for span in _AMZ_OFFER_SPANS.select(soup):
             text = span.get_text().strip()
-            if text and len(text) > 10:
-                if 'bank' in text.lower() or 'card' in text.lower():
-                    if text not in offers['bank_offers']:
-                        offers['bank_offers'].append(text)
+            if len(text) > 10 and text not in seen and _BANK_OR_CARD.search(text):
+                offers['bank_offers'].append(text)
+                seen.add(text)
         
-        # Exchange offer
-        exchange_elem = soup.find(string=re.compile('exchange', re.I))
+        # Exchange offer (most pages have none, so skip the text-node walk
+        # unless the word is on the page at all)
+        exchange_elem = soup.find(string=_EXCHANGE) if 'exchange' in page_text else None
         if exchange_elem:
             parent = exchange_elem.find_parent()
             if parent:
@@ -187,14 +271,14 @@ class CouponOfferExtractor:
                     offers['exchange_offers'].append(exchange_text)
         
         # No cost EMI
-        if 'no cost emi' in soup.get_text().lower():
+        if _NO_COST_EMI in page_text:
             offers['no_cost_emi'] = True
         
         return offers
     
     @staticmethod
-    def extract_flipkart(soup: BeautifulSoup) -> Dict:
-        """Extract coupons and offers from Flipkart."""
+    def extract_flipkart(soup: BeautifulSoup, page_text: Optional[str] = None) -> Dict:
+        """Extract coupons and offers from Flipkart (page_text: lowercased page HTML or text, if already built)."""
         offers = {
             'coupons': [],
             'bank_offers': [],
@@ -202,32 +286,38 @@ class CouponOfferExtractor:
             'no_cost_emi': False
         }
         
-        # Bank offers section
-        for div in soup.find_all('div', class_=re.compile('.*offer.*|.*promo.*', re.I)):
+        if page_text is None:
+            page_text = soup.get_text().lower()
+        
+        # Bank offers section (set mirrors the list for O(1) dedup)
+        seen = set()
+        for div in _FK_OFFER_DIVS.select(soup):
             text = div.get_text().strip()
-            if 'bank' in text.lower() or 'card' in text.lower():
-                if text and len(text) > 10 and text not in offers['bank_offers']:
-                    offers['bank_offers'].append(text)
+            if len(text) > 10 and text not in seen and _BANK_OR_CARD.search(text):
+                offers['bank_offers'].append(text)
+                seen.add(text)
         
         # Exchange offer
-        if 'exchange offer' in soup.get_text().lower():
-            for elem in soup.find_all(string=re.compile('exchange', re.I)):
+        if _EXCHANGE_OFFER in page_text:
+            # find_all(limit=...) stops the walk at the first hits instead of
+            # collecting every matching string on the page
+            for elem in soup.find_all(string=_EXCHANGE, limit=5):
                 parent = elem.find_parent()
                 if parent:
                     text = parent.get_text().strip()
-                    if text and 'exchange' in text.lower():
+                    if text and _EXCHANGE.search(text):
                         offers['exchange_offers'].append(text)
                         break
         
         # No cost EMI
-        if 'no cost emi' in soup.get_text().lower():
+        if _NO_COST_EMI in page_text:
             offers['no_cost_emi'] = True
         
         return offers
     
     @staticmethod
-    def extract_generic(soup: BeautifulSoup) -> Dict:
-        """Generic offer extraction."""
+    def extract_generic(soup: BeautifulSoup, page_text: Optional[str] = None) -> Dict:
+        """Generic offer extraction (page_text: lowercased page HTML or text, if already built)."""
         offers = {
             'coupons': [],
             'bank_offers': [],
@@ -235,10 +325,11 @@ class CouponOfferExtractor:
             'no_cost_emi': False
         }
         
-        page_text = soup.get_text().lower()
+        if page_text is None:
+            page_text = soup.get_text().lower()
         
         # Look for bank offers
-        for elem in soup.find_all(string=re.compile('bank.*offer|card.*offer|cashback', re.I)):
+        for elem in soup.find_all(string=_BANK_OFFER):
             parent = elem.find_parent()
             if parent:
                 text = parent.get_text().strip()
@@ -246,7 +337,7 @@ class CouponOfferExtractor:
                     offers['bank_offers'].append(text)
         
         # No cost EMI
-        if 'no cost emi' in page_text:
+        if _NO_COST_EMI in page_text:
             offers['no_cost_emi'] = True
         
         return offers
@@ -305,20 +396,23 @@ class FinalPriceCalculator:
     @staticmethod
     def _extract_discount_amount(offer_text: str, base_price: float) -> float:
         """Extract discount amount from offer text."""
+        # Cheap character checks first; most offer texts have no % or ₹
         # Look for percentage discount (e.g., "10% off")
-        pct_match = re.search(r'(\d+(?:\.\d+)?)\s*%', offer_text)
-        if pct_match:
-            percentage = float(pct_match.group(1))
-            return (base_price * percentage) / 100
+        if '%' in offer_text:
+            pct_match = _PCT_DISCOUNT.search(offer_text)
+            if pct_match:
+                percentage = float(pct_match.group(1))
+                return (base_price * percentage) / 100
         
         # Look for flat discount (e.g., "₹500 off")
-        flat_match = re.search(r'₹\s*(\d+(?:,\d+)*(?:\.\d+)?)', offer_text)
-        if flat_match:
-            amount_str = flat_match.group(1).replace(',', '')
-            return float(amount_str)
+        if '₹' in offer_text:
+            flat_match = _FLAT_RS.search(offer_text)
+            if flat_match:
+                amount_str = flat_match.group(1).translate(_DROP_SEPARATORS)
+                return float(amount_str)
         
         # Look for "Flat 500" pattern
-        flat_match2 = re.search(r'flat\s+(\d+)', offer_text, re.I)
+        flat_match2 = _FLAT_N.search(offer_text)
         if flat_match2:
             return float(flat_match2.group(1))
         
@@ -332,6 +426,18 @@ class ProductScraperEnhancer:
         self.stock_detector = StockAvailabilityDetector()
         self.offer_extractor = CouponOfferExtractor()
         self.price_calculator = FinalPriceCalculator()
+        
+        # Platform -> handler tables; anything else uses the generic handler
+        detector = self.stock_detector
+        self._stock_dispatch = {
+            'amazon': detector.detect_amazon,
+            'flipkart': lambda soup, html, html_lower: detector.detect_flipkart(soup),
+            'myntra': lambda soup, html, html_lower: detector.detect_myntra(soup),
+        }
+        self._offer_dispatch = {
+            'amazon': self.offer_extractor.extract_amazon,
+            'flipkart': self.offer_extractor.extract_flipkart,
+        }
     
     def enhance(self, scraped_data: Dict, soup: BeautifulSoup, html: str, url: str) -> Dict:
         """
@@ -349,14 +455,19 @@ class ProductScraperEnhancer:
         # Detect platform
         platform = self._detect_platform(url)
         
+        # Whole-page phrase checks are plain substring probes on the raw
+        # HTML minus scripts/styles, lowercased once here and shared by the
+        # detectors/extractors
+        html_lower = _SCRIPT_STYLE.sub('', html).lower()
+        
         # Detect stock availability
-        stock_status = self._detect_stock(platform, soup, html)
+        stock_status = self._detect_stock(platform, soup, html, html_lower)
         scraped_data['stock_status'] = stock_status['stock_level']
         scraped_data['in_stock'] = stock_status['in_stock']
         scraped_data['stock_message'] = stock_status['stock_message']
         
         # Extract offers
-        offers = self._extract_offers(platform, soup)
+        offers = self._extract_offers(platform, soup, html_lower)
         scraped_data['offers'] = offers
         scraped_data['has_coupon'] = len(offers['coupons']) > 0
         scraped_data['has_bank_offer'] = len(offers['bank_offers']) > 0
@@ -375,6 +486,17 @@ class ProductScraperEnhancer:
     
     def _detect_platform(self, url: str) -> str:
         """Detect e-commerce platform from URL."""
+        host = urlparse(url).hostname
+        if host:
+            # Match on the host only, so "amazon" in a path or affiliate tag
+            # doesn't misroute the page
+            for label in host.split('.'):
+                platform = _PLATFORMS.get(label)
+                if platform:
+                    return platform
+            return 'generic'
+        
+        # No scheme/host (e.g. "flipkart.com/..."): match anywhere in the URL
         url_lower = url.lower()
         if 'amazon' in url_lower:
             return 'amazon'
@@ -389,25 +511,16 @@ class ProductScraperEnhancer:
         else:
             return 'generic'
     
-    def _detect_stock(self, platform: str, soup: BeautifulSoup, html: str) -> Dict:
+    def _detect_stock(self, platform: str, soup: BeautifulSoup, html: str,
+                      html_lower: Optional[str] = None) -> Dict:
         """Detect stock availability based on platform."""
-        if platform == 'amazon':
-            return self.stock_detector.detect_amazon(soup, html)
-        elif platform == 'flipkart':
-            return self.stock_detector.detect_flipkart(soup)
-        elif platform == 'myntra':
-            return self.stock_detector.detect_myntra(soup)
-        else:
-            return self.stock_detector.detect_generic(soup, html)
+        detect = self._stock_dispatch.get(platform, self.stock_detector.detect_generic)
+        return detect(soup, html, html_lower)
     
-    def _extract_offers(self, platform: str, soup: BeautifulSoup) -> Dict:
+    def _extract_offers(self, platform: str, soup: BeautifulSoup, page_text: Optional[str] = None) -> Dict:
         """Extract offers based on platform."""
-        if platform == 'amazon':
-            return self.offer_extractor.extract_amazon(soup)
-        elif platform == 'flipkart':
-            return self.offer_extractor.extract_flipkart(soup)
-        else:
-            return self.offer_extractor.extract_generic(soup)
+        extract = self._offer_dispatch.get(platform, self.offer_extractor.extract_generic)
+        return extract(soup, page_text)
 
 
 # ============================================================================
@@ -4,15 +4,17 @@ Uses browser automation to bypass anti-bot measures
 """
 
 import logging
+from contextlib import nullcontext
+from itertools import islice
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 import re
 
 from utils.helpers import (
+    make_soup,
     extract_price,
     calculate_discount_percentage,
     clean_text,
+    join_url,
     validate_url,
     format_deal_data,
     rate_limiter
@@ -31,12 +33,13 @@ class AjioScraper:
     def __init__(self):
         self.website_name = "Ajio"
     
-    def scrape_deals(self, max_deals: int = 50) -> List[Dict]:
+    def scrape_deals(self, max_deals: int = 50, browser: Optional[BrowserHelper] = None) -> List[Dict]:
         """
         Scrape deals from Ajio using browser automation
         
         Args:
             max_deals: Maximum number of deals to scrape
+            browser: Open BrowserHelper to reuse (optional; left open)
             
         Returns:
             List of deal dictionaries
@@ -52,7 +55,8 @@ class AjioScraper:
         ]
         
         try:
-            with BrowserHelper() as browser:
+            # Reuse the caller's browser if given, else launch (and close) our own
+            with (nullcontext(browser) if browser is not None else BrowserHelper()) as browser:
                 for category_url in category_urls:
                     if len(deals) >= max_deals:
                         break
@@ -69,19 +73,21 @@ class AjioScraper:
                         logger.warning(f"Failed to fetch {category_url}")
                         continue
                     
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    # Blocked/captcha pages carry no product links; skip the parse
+                    if '/p/' not in html_content:
+                        logger.warning(f"No products on {category_url} (blocked or empty?)")
+                        continue
+                    
+                    soup = make_soup(html_content)
                     
                     # Find product containers or links
                     deal_containers = soup.find_all('a', href=re.compile(r'/p/'))
                     
                     logger.info(f"Found {len(deal_containers)} products")
                     
-                    for container in deal_containers:
-                        if len(deals) >= max_deals:
-                            break
-                        deal = self._extract_deal_from_link(container)
-                        if deal:
-                            deals.append(deal)
+                    # islice stops extracting as soon as the limit is reached
+                    deals_iter = map(self._extract_deal_from_link, deal_containers)
+                    deals.extend(islice(filter(None, deals_iter), max_deals - len(deals)))
             
             logger.info(f"✓ Scraped {len(deals)} deals from {self.website_name}")
             
@@ -94,7 +100,7 @@ class AjioScraper:
         """Extract deal information from a product link"""
         try:
             # Product URL
-            product_url = urljoin(self.BASE_URL, link_elem.get('href', ''))
+            product_url = join_url(self.BASE_URL, link_elem.get('href', ''))
             if not product_url or not validate_url(product_url):
                 return None
             
@@ -179,7 +185,7 @@ class AjioScraper:
             link_elem = container.find('a', href=True)
             product_url = None
             if link_elem:
-                product_url = urljoin(self.BASE_URL, link_elem['href'])
+                product_url = join_url(self.BASE_URL, link_elem['href'])
             
             if not product_url or not validate_url(product_url):
                 return None
@@ -242,18 +248,19 @@ class AjioScraper:
         return words[0] if words else 'Unknown'
 
 
-def scrape_ajio_deals(max_deals: int = 50) -> List[Dict]:
+def scrape_ajio_deals(max_deals: int = 50, browser: Optional[BrowserHelper] = None) -> List[Dict]:
     """
     Main function to scrape Ajio deals
     
     Args:
         max_deals: Maximum number of deals to scrape
+        browser: Open BrowserHelper to reuse (optional)
         
     Returns:
         List of deal dictionaries
     """
     scraper = AjioScraper()
-    return scraper.scrape_deals(max_deals)
+    return scraper.scrape_deals(max_deals, browser=browser)
 
 
 if __name__ == "__main__":
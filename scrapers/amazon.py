@@ -4,16 +4,20 @@ Scrapes deals from Amazon India's deals page
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 import re
 
+from lxml import etree
+from lxml import html as lxml_html
+
 from utils.helpers import (
     fetch_page,
+    response_encoding,
     extract_price,
     calculate_discount_percentage,
     clean_text,
+    join_url,
     validate_url,
     format_deal_data,
     rate_limiter
@@ -23,11 +27,60 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _has_class(name: str) -> str:
+    """XPath predicate for an element carrying CSS class `name`"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Result cards and their fields as compiled XPath, evaluated in C by lxml
+_RESULTS_XP = etree.XPath('//div[@data-component-type="s-search-result"]')
+_NAME_XP = etree.XPath('.//h2[contains(@class, "a-size")]')
+_LINK_XP = etree.XPath('.//a[contains(@href, "/dp/") or contains(@href, "/gp/")]/@href')
+_IMAGE_XP = etree.XPath(f'.//img[{_has_class("s-image")}]/@src')
+
+# Screen-reader copies of the prices ("₹1,299.00"), already fully formatted
+_OFFER_OFFSCREEN_XP = etree.XPath(
+    f'.//span[{_has_class("a-price")} and not({_has_class("a-text-price")})]'
+    f'/span[{_has_class("a-offscreen")}]'
+)
+_MRP_OFFSCREEN_XP = etree.XPath(
+    f'.//span[{_has_class("a-price")} and {_has_class("a-text-price")}]'
+    f'/span[{_has_class("a-offscreen")}]'
+)
+_PRICE_WHOLE_XP = etree.XPath(f'.//span[{_has_class("a-price-whole")}]')
+_PRICE_FRACTION_XP = etree.XPath(f'.//span[{_has_class("a-price-fraction")}]')
+_MRP_XP = etree.XPath('.//span[@class="a-price a-text-price"]')
+_DROP_SEPARATORS = str.maketrans('', '', ', \xa0')
+
+# Common brand names matched against the product name
+_BRANDS = (
+    'Samsung', 'Apple', 'OnePlus', 'Xiaomi', 'Realme', 'Vivo', 'Oppo',
+    'Sony', 'LG', 'Boat', 'Noise', 'Fire-Boltt', 'Amazon Basics',
+    'Redmi', 'Mi', 'Poco', 'Motorola', 'Nokia', 'Google', 'Nothing'
+)
+_BRAND_NAMES = {brand.lower(): brand for brand in _BRANDS}
+
+# All brands in one pattern, longest first so 'Redmi' isn't read as 'Mi';
+# word boundaries keep 'Mi' from matching inside 'mini'. The leftmost brand
+# in the name wins.
+_BRAND_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(brand) for brand in sorted(_BRANDS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+
+
+def _first_text(xpath: etree.XPath, element) -> Optional[str]:
+    """Text content of the first node `xpath` finds under element, if any"""
+    nodes = xpath(element)
+    return ''.join(nodes[0].itertext()) if nodes else None
+
+
 class AmazonScraper:
     """Scraper for Amazon India daily deals"""
     
     BASE_URL = "https://www.amazon.in"
     DEALS_URL = "https://www.amazon.in/s?k=deals&rh=p_n_pct-off-with-tax%3A2665400031"  # Updated to search page
+    EXTRACT_WORKERS = 8
     
     def __init__(self):
         self.website_name = "Amazon India"
@@ -55,17 +108,20 @@ class AmazonScraper:
                 logger.error(f"Failed to fetch {self.website_name} deals page")
                 return deals
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            parser = lxml_html.HTMLParser(encoding=response_encoding(response))
+            tree = lxml_html.document_fromstring(response.content, parser=parser)
             
             # Find search results - this is the working selector
-            deal_containers = soup.find_all('div', {'data-component-type': 's-search-result'})
+            deal_containers = _RESULTS_XP(tree)
             
             logger.info(f"Found {len(deal_containers)} deal containers")
             
-            for container in deal_containers[:max_deals]:
-                deal = self._extract_deal_from_container(container)
-                if deal:
-                    deals.append(deal)
+            # Containers are independent and only read from the tree, so
+            # extract them side by side; map() keeps the page order
+            with ThreadPoolExecutor(max_workers=self.EXTRACT_WORKERS) as executor:
+                for deal in executor.map(self._extract_deal_from_container, deal_containers[:max_deals]):
+                    if deal:
+                        deals.append(deal)
             
             logger.info(f"✓ Scraped {len(deals)} deals from {self.website_name}")
             
@@ -78,37 +134,40 @@ class AmazonScraper:
         """Extract deal information from a search result container"""
         try:
             # Product name - h2 inside search results
-            name_elem = container.find('h2', class_=re.compile(r'a-size'))
-            product_name = clean_text(name_elem.get_text()) if name_elem else None
+            name_text = _first_text(_NAME_XP, container)
+            product_name = clean_text(name_text) if name_text else None
             
             if not product_name:
                 return None
             
             # Product URL - link from h2
-            link_elem = container.find('a', href=re.compile(r'/dp/|/gp/'))
-            product_url = urljoin(self.BASE_URL, link_elem['href']) if link_elem else None
+            links = _LINK_XP(container)
+            product_url = join_url(self.BASE_URL, links[0]) if links else None
             
             if not product_url or not validate_url(product_url):
                 return None
             
             # Image URL
-            img_elem = container.find('img', {'class': 's-image'})
-            image_url = img_elem.get('src') if img_elem else None
-            
-            # Discounted price - look for a-price-whole
-            price_whole = container.find('span', class_='a-price-whole')
-            price_fraction = container.find('span', class_='a-price-fraction')
+            images = _IMAGE_XP(container)
+            image_url = images[0] if images else None
             
+            # Discounted price - the a-offscreen copy, else a-price-whole + fraction
             discounted_price = None
-            if price_whole:
-                price_text = price_whole.get_text().replace(',', '') + (price_fraction.get_text() if price_fraction else '')
+            price_text = _first_text(_OFFER_OFFSCREEN_XP, container)
+            if price_text:
                 discounted_price = extract_price(price_text)
-            
-            # Original price - look for a-text-price
-            original_price_elem = container.find('span', class_='a-price a-text-price')
+            else:
+                price_whole = _first_text(_PRICE_WHOLE_XP, container)
+                if price_whole:
+                    price_fraction = _first_text(_PRICE_FRACTION_XP, container)
+                    price_text = price_whole.translate(_DROP_SEPARATORS) + (price_fraction or '')
+                    discounted_price = extract_price(price_text)
+            
+            # Original price - look for a-text-price (its offscreen copy alone,
+            # since the full text repeats the amount)
             original_price = None
-            if original_price_elem:
-                price_text = original_price_elem.get_text()
+            price_text = _first_text(_MRP_OFFSCREEN_XP, container) or _first_text(_MRP_XP, container)
+            if price_text:
                 original_price = extract_price(price_text)
             
             # Calculate discount
@@ -144,16 +203,9 @@ class AmazonScraper:
         if not product_name:
             return 'Unknown'
         
-        # Common brand patterns
-        common_brands = [
-            'Samsung', 'Apple', 'OnePlus', 'Xiaomi', 'Realme', 'Vivo', 'Oppo',
-            'Sony', 'LG', 'Boat', 'Noise', 'Fire-Boltt', 'Amazon Basics',
-            'Redmi', 'Mi', 'Poco', 'Motorola', 'Nokia', 'Google', 'Nothing'
-        ]
-        
-        for brand in common_brands:
-            if brand.lower() in product_name.lower():
-                return brand
+        match = _BRAND_RE.search(product_name)
+        if match:
+            return _BRAND_NAMES[match.group(1).lower()]
         
         # Return first word as brand
         words = product_name.split()
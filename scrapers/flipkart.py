@@ -3,17 +3,33 @@ Flipkart Daily Deals Scraper
 Scrapes deals from Flipkart's deals page
 """
 
+import asyncio
+import functools
 import logging
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import random
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterator, List, Dict, Optional
 import re
 
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 from utils.helpers import (
+    get_session_with_retries,
+    get_request_headers,
     fetch_page,
+    response_encoding,
+    find_parent_node,
     extract_price,
     calculate_discount_percentage,
     clean_text,
+    join_url,
     validate_url,
     format_deal_data,
     rate_limiter
@@ -22,15 +38,66 @@ from utils.helpers import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Class patterns for the bs4 container extractor, compiled once per process
+_FK_NAME_RE = re.compile(r'_4rR01T|s1Q9rs|_2WkVRV')
+_FK_PRICE_RE = re.compile(r'_30jeq3|_3I9_wc')
+_FK_ORIG_PRICE_RE = re.compile(r'_3Ay6sb|_2_R_DZ')
+_FK_DISCOUNT_RE = re.compile(r'_3Ay6sb|_3xFx9B')
+_FK_CATEGORY_RE = re.compile(r'_3LWZlK|_2WkVRV')
+_DISCOUNT_PCT_RE = re.compile(r'(\d+)%')
+
+# Price nodes on a search card: selling price and struck-out MRP, fetched in
+# one subtree walk and told apart by class
+_FK_PRICE_CLASSES = ('_30jeq3', '_1_WHN1')
+_FK_MRP_CLASSES = ('_3I9_wc', '_2_R_DZ')
+_FK_PRICE_NODES = ', '.join(f'div[class*="{c}"]' for c in _FK_PRICE_CLASSES + _FK_MRP_CLASSES)
+
+# Common brand names matched against the product name
+_BRANDS = (
+    'Samsung', 'Apple', 'OnePlus', 'Xiaomi', 'Realme', 'Vivo', 'Oppo',
+    'Sony', 'LG', 'Boat', 'Noise', 'Fire-Boltt', 'Redmi', 'Mi', 'Poco',
+    'Motorola', 'Nokia', 'Google', 'Nothing', 'Puma', 'Adidas', 'Nike',
+    'Levi', 'H&M', 'Zara', 'UCB', 'Allen Solly', 'Peter England'
+)
+_BRAND_NAMES = {brand.lower(): brand for brand in _BRANDS}
+
+# All brands in one pattern, longest first so 'Redmi' isn't read as 'Mi';
+# word boundaries keep 'Mi' from matching inside 'mini'. The leftmost brand
+# in the name wins.
+_BRAND_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(brand) for brand in sorted(_BRANDS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _brand_for_name(product_name: str) -> str:
+    """Brand for a product name (cached; listings repeat the same names)"""
+    match = _BRAND_RE.search(product_name)
+    if match:
+        return _BRAND_NAMES[match.group(1).lower()]
+    
+    words = product_name.split()
+    return words[0] if words else 'Unknown'
+
 
 class FlipkartScraper:
     """Scraper for Flipkart daily deals"""
     
     BASE_URL = "https://www.flipkart.com"
     DEALS_URL = "https://www.flipkart.com/search?q=mobile&sort=popularity"  # More reliable search page
+    FETCH_WORKERS = 3
     
     def __init__(self):
         self.website_name = "Flipkart"
+        # All searches hit www.flipkart.com, so keep the connection (and TLS
+        # session) alive between them instead of a new session per fetch.
+        # Only the thread fallback uses it: with aiohttp, each scrape_deals()
+        # call shares one ClientSession across its searches, and that session
+        # can't outlive the event loop asyncio.run() makes for the call
+        self.session = None if AIOHTTP_AVAILABLE else get_session_with_retries(
+            pool_maxsize=self.FETCH_WORKERS
+        )
     
     def scrape_deals(self, max_deals: int = 50) -> List[Dict]:
         """
@@ -44,6 +111,7 @@ class FlipkartScraper:
         """
         logger.info(f"🔍 Starting {self.website_name} scraper...")
         deals = []
+        seen_products = set()  # Product paths already extracted
         
         # Try multiple search queries to get variety
         search_queries = [
@@ -52,31 +120,25 @@ class FlipkartScraper:
             'https://www.flipkart.com/search?q=electronics&sort=popularity'
         ]
         
-        for search_url in search_queries:
+        # The searches are independent network waits, so fetch them side by
+        # side (one aiohttp session, or worker threads without aiohttp);
+        # pages come back in query order and are parsed here
+        if AIOHTTP_AVAILABLE:
+            pages = asyncio.run(self._fetch_search_pages_async(search_queries))
+        else:
+            with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as executor:
+                pages = list(executor.map(self._fetch_search_page, search_queries))
+        
+        for i, search_url in enumerate(search_queries):
+            # Drop our reference to the raw page once it has been parsed
+            html_content, pages[i] = pages[i], None
             try:
-                # Respect rate limiting
-                rate_limiter.wait()
-                
-                # Fetch search page
-                response = fetch_page(search_url, timeout=15)
-                if not response:
+                if not html_content:
                     logger.warning(f"Failed to fetch {search_url}")
                     continue
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find product links - most reliable selector
-                product_links = soup.find_all('a', href=re.compile(r'/p/'))
-                
-                logger.info(f"Found {len(product_links)} products in search results")
-                
-                for link in product_links:
-                    if len(deals) >= max_deals:
-                        break
-                        
-                    deal = self._extract_deal_from_link(link)
-                    if deal:
-                        deals.append(deal)
+                deals.extend(self._extract_page_deals(html_content, max_deals - len(deals), seen_products))
+                del html_content
                 
                 if len(deals) >= max_deals:
                     break
@@ -88,36 +150,147 @@ class FlipkartScraper:
         logger.info(f"✓ Scraped {len(deals)} deals from {self.website_name}")
         return deals
     
+    async def _fetch_search_pages_async(self, search_urls: List[str]) -> List[Optional[str]]:
+        """
+        Fetch all search pages over one aiohttp session
+        
+        Args:
+            search_urls: Search result URLs
+            
+        Returns:
+            HTML per URL (None where the fetch failed), in input order
+        """
+        # aiohttp only decodes br with Brotli installed, so let it negotiate
+        headers = {k: v for k, v in get_request_headers().items()
+                   if k.lower() != 'accept-encoding'}
+        connector = aiohttp.TCPConnector(limit_per_host=self.FETCH_WORKERS)
+        timeout = aiohttp.ClientTimeout(total=15)
+        semaphore = asyncio.Semaphore(self.FETCH_WORKERS)
+        
+        async def _fetch(session, search_url: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    # Same pacing as fetch_page: shared rate limiter plus jitter
+                    await asyncio.to_thread(rate_limiter.wait)
+                    await asyncio.sleep(random.uniform(1.0, 3.0))
+                    
+                    async with session.get(search_url) as response:
+                        response.raise_for_status()
+                        html_content = await response.text(
+                            encoding=response.charset or 'utf-8', errors='replace'
+                        )
+                    logger.info(f"✓ Successfully fetched: {search_url[:80]}...")
+                    return html_content
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.error(f"✗ Error fetching {search_url}: {e}")
+                    return None
+        
+        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(*(_fetch(session, url) for url in search_urls))
+    
+    def _extract_page_deals(self, html_content, limit: int, seen_products: set) -> List[Dict]:
+        """
+        Extract up to `limit` deals from one search page
+        
+        The Lexbor tree only lives for this call, so each page's tree is freed
+        before the next one is parsed.
+        
+        Args:
+            html_content: Page HTML (str, or UTF-8 bytes)
+            limit: Maximum number of deals to return
+            seen_products: Product paths already extracted (updated in place)
+            
+        Returns:
+            List of deal dictionaries
+        """
+        # Blocked/captcha pages carry no product links at all; a substring
+        # check is far cheaper than building a tree to find that out
+        marker = b'/p/' if isinstance(html_content, bytes) else '/p/'
+        if marker not in html_content:
+            logger.warning("No product links on page (blocked or empty?), skipping parse")
+            return []
+        
+        # Lexbor keeps the tree in C and answers CSS queries there
+        tree = LexborHTMLParser(html_content)
+        
+        # Find product links - most reliable selector
+        product_links = tree.css('a[href*="/p/"]')
+        
+        logger.info(f"Found {len(product_links)} products in search results")
+        
+        # islice stops pulling links as soon as the limit is reached
+        return list(islice(self._iter_new_deals(product_links, seen_products), limit))
+    
+    def _iter_new_deals(self, links, seen_products: set) -> Iterator[Dict]:
+        """Yield deals for product links not extracted yet"""
+        for link in links:
+            # Image, title and price links all point at the same
+            # product; once one of them yielded a deal skip the rest
+            product_key = (link.attributes.get('href') or '').split('?')[0]
+            if product_key in seen_products:
+                continue
+            
+            deal = self._extract_deal_from_link(link)
+            if deal:
+                seen_products.add(product_key)
+                yield deal
+    
+    def _fetch_search_page(self, search_url: str):
+        """Fetch one search page (runs on a worker thread)"""
+        try:
+            # Respect rate limiting - the shared limiter staggers the workers
+            rate_limiter.wait()
+            response = fetch_page(search_url, timeout=15, session=self.session)
+            if not response:
+                return None
+            
+            # Lexbor reads UTF-8 bytes as is; only other charsets need a
+            # decoded copy of the page
+            encoding = response_encoding(response)
+            if encoding.lower().replace('-', '') == 'utf8':
+                return response.content
+            return response.content.decode(encoding, 'replace')
+        except Exception as e:
+            logger.error(f"Error fetching {search_url}: {e}")
+            return None
+    
     def _extract_deal_from_link(self, link_elem) -> Optional[Dict]:
-        """Extract deal information from a product link element"""
+        """Extract deal information from a product link node (selectolax)"""
         try:
+            attrs = link_elem.attributes
+            
             # Product URL
-            product_url = urljoin(self.BASE_URL, link_elem.get('href', ''))
+            product_url = join_url(self.BASE_URL, attrs.get('href') or '')
             if not product_url or not validate_url(product_url):
                 return None
             
             # Product name - from title attribute or text
-            product_name = link_elem.get('title') or clean_text(link_elem.get_text())
+            product_name = attrs.get('title') or clean_text(link_elem.text())
             if not product_name:
                 return None
             
             # Find parent container for more info
-            container = link_elem.find_parent('div', class_=re.compile(r'_1AtVbE|slAVV4|CGtC98'))
+            container = find_parent_node(link_elem, ('div',), ('_1AtVbE', 'slAVV4', 'CGtC98'))
             if not container:
                 container = link_elem
             
             # Image URL
-            img_elem = container.find('img')
+            img_elem = container.css_first('img')
             image_url = None
             if img_elem:
-                image_url = img_elem.get('src') or img_elem.get('data-src')
+                image_url = img_elem.attributes.get('src') or img_elem.attributes.get('data-src')
             
-            # Prices - Flipkart uses specific classes
-            price_elem = container.find('div', class_=re.compile(r'_30jeq3|_1_WHN1'))
-            original_price_elem = container.find('div', class_=re.compile(r'_3I9_wc|_2_R_DZ'))
+            # Prices - Flipkart uses specific classes; first of each kind wins
+            price_elem = original_price_elem = None
+            for elem in container.css(_FK_PRICE_NODES):
+                css_class = elem.attributes.get('class') or ''
+                if price_elem is None and any(c in css_class for c in _FK_PRICE_CLASSES):
+                    price_elem = elem
+                elif original_price_elem is None and any(c in css_class for c in _FK_MRP_CLASSES):
+                    original_price_elem = elem
             
-            discounted_price = extract_price(price_elem.get_text()) if price_elem else None
-            original_price = extract_price(original_price_elem.get_text()) if original_price_elem else None
+            discounted_price = extract_price(price_elem.text()) if price_elem else None
+            original_price = extract_price(original_price_elem.text()) if original_price_elem else None
             
             # Calculate discount
             discount_percentage = calculate_discount_percentage(original_price, discounted_price)
@@ -151,7 +324,7 @@ class FlipkartScraper:
         """Extract deal information from a container element"""
         try:
             # Product name
-            name_elem = container.find(['div', 'a'], class_=re.compile(r'_4rR01T|s1Q9rs|_2WkVRV'))
+            name_elem = container.find(['div', 'a'], class_=_FK_NAME_RE)
             if not name_elem:
                 name_elem = container.find('img', alt=True)
             
@@ -169,7 +342,7 @@ class FlipkartScraper:
             link_elem = container if container.name == 'a' else container.find('a', href=True)
             product_url = None
             if link_elem and link_elem.get('href'):
-                product_url = urljoin(self.BASE_URL, link_elem['href'])
+                product_url = join_url(self.BASE_URL, link_elem['href'])
             
             if not product_url or not validate_url(product_url):
                 return None
@@ -179,17 +352,17 @@ class FlipkartScraper:
             image_url = img_elem['src'] if img_elem else None
             
             # Prices
-            price_elem = container.find(['div'], class_=re.compile(r'_30jeq3|_3I9_wc'))
-            original_price_elem = container.find(['div'], class_=re.compile(r'_3Ay6sb|_2_R_DZ'))
+            price_elem = container.find(['div'], class_=_FK_PRICE_RE)
+            original_price_elem = container.find(['div'], class_=_FK_ORIG_PRICE_RE)
             
             discounted_price = extract_price(price_elem.get_text()) if price_elem else None
             original_price = extract_price(original_price_elem.get_text()) if original_price_elem else None
             
             # Extract discount percentage
-            discount_elem = container.find(['div', 'span'], class_=re.compile(r'_3Ay6sb|_3xFx9B'))
+            discount_elem = container.find(['div', 'span'], class_=_FK_DISCOUNT_RE)
             if discount_elem:
                 discount_text = discount_elem.get_text()
-                discount_match = re.search(r'(\d+)%', discount_text)
+                discount_match = _DISCOUNT_PCT_RE.search(discount_text)
                 if discount_match and not original_price and discounted_price:
                     discount_pct = int(discount_match.group(1))
                     original_price = discounted_price / (1 - discount_pct / 100)
@@ -198,7 +371,7 @@ class FlipkartScraper:
             discount_percentage = calculate_discount_percentage(original_price, discounted_price)
             
             # Category
-            category_elem = container.find(['div', 'span'], class_=re.compile(r'_3LWZlK|_2WkVRV'))
+            category_elem = container.find(['div', 'span'], class_=_FK_CATEGORY_RE)
             category = clean_text(category_elem.get_text()) if category_elem else 'General'
             
             # Brand
@@ -227,20 +400,7 @@ class FlipkartScraper:
         """Try to extract brand from product name"""
         if not product_name:
             return 'Unknown'
-        
-        common_brands = [
-            'Samsung', 'Apple', 'OnePlus', 'Xiaomi', 'Realme', 'Vivo', 'Oppo',
-            'Sony', 'LG', 'Boat', 'Noise', 'Fire-Boltt', 'Redmi', 'Mi', 'Poco',
-            'Motorola', 'Nokia', 'Google', 'Nothing', 'Puma', 'Adidas', 'Nike',
-            'Levi', 'H&M', 'Zara', 'UCB', 'Allen Solly', 'Peter England'
-        ]
-        
-        for brand in common_brands:
-            if brand.lower() in product_name.lower():
-                return brand
-        
-        words = product_name.split()
-        return words[0] if words else 'Unknown'
+        return _brand_for_name(product_name)
 
 
 def scrape_flipkart_deals(max_deals: int = 50) -> List[Dict]:
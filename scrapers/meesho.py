@@ -4,15 +4,19 @@ Uses browser automation to bypass anti-bot measures
 """
 
 import logging
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from contextlib import nullcontext
+from itertools import islice
+from typing import Iterator, List, Dict, Optional
 import re
 
+from selectolax.lexbor import LexborHTMLParser
+
 from utils.helpers import (
+    find_parent_node,
     extract_price,
     calculate_discount_percentage,
     clean_text,
+    join_url,
     validate_url,
     format_deal_data,
     rate_limiter
@@ -22,6 +26,13 @@ from utils.browser_helper import BrowserHelper
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Class patterns for the bs4 container extractor, compiled once per process
+_MEESHO_NAME_RE = re.compile(r'Name|Title')
+_MEESHO_PRICE_RE = re.compile(r'Price|price')
+_MEESHO_ORIG_PRICE_RE = re.compile(r'OriginalPrice|strike')
+_MEESHO_DISCOUNT_RE = re.compile(r'Discount|discount')
+_DISCOUNT_PCT_RE = re.compile(r'(\d+)%')
+
 
 class MeeshoScraper:
     """Scraper for Meesho daily deals"""
@@ -31,18 +42,21 @@ class MeeshoScraper:
     def __init__(self):
         self.website_name = "Meesho"
     
-    def scrape_deals(self, max_deals: int = 50) -> List[Dict]:
+    def scrape_deals(self, max_deals: int = 50, browser: Optional[BrowserHelper] = None) -> List[Dict]:
         """
         Scrape deals from Meesho using browser automation
         
         Args:
             max_deals: Maximum number of deals to scrape
+            browser: Open BrowserHelper to reuse (optional); without one a single
+                browser is launched for all categories
             
         Returns:
             List of deal dictionaries
         """
         logger.info(f"🔍 Starting {self.website_name} scraper with browser automation...")
         deals = []
+        seen_products = set()  # Product paths already extracted
         
         # Category URLs to scrape
         category_urls = [
@@ -52,36 +66,21 @@ class MeeshoScraper:
         ]
         
         try:
-            with BrowserHelper() as browser:
-                for category_url in category_urls:
+            # Reuse the caller's browser if given, else launch (and close) our
+            # own; categories render one at a time on that one browser
+            with (nullcontext(browser) if browser is not None else BrowserHelper()) as browser:
+                pages = (self._fetch_category(url, browser) for url in category_urls)
+                
+                for category_url, html_content in zip(category_urls, pages):
                     if len(deals) >= max_deals:
                         break
                     
-                    # Respect rate limiting
-                    rate_limiter.wait()
-                    
-                    logger.info(f"Fetching {category_url}...")
-                    
-                    # Fetch page with browser and scroll to load lazy content
-                    html_content = browser.fetch_page_with_scroll(category_url, scroll_count=3)
-                    
                     if not html_content:
                         logger.warning(f"Failed to fetch {category_url}")
                         continue
                     
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    
-                    # Find product containers or links
-                    deal_containers = soup.find_all('a', href=re.compile(r'/p/'))
-                    
-                    logger.info(f"Found {len(deal_containers)} products")
-                    
-                    for container in deal_containers:
-                        if len(deals) >= max_deals:
-                            break
-                        deal = self._extract_deal_from_link(container)
-                        if deal:
-                            deals.append(deal)
+                    deals.extend(self._extract_page_deals(html_content, max_deals - len(deals), seen_products))
+                    del html_content
             
             logger.info(f"✓ Scraped {len(deals)} deals from {self.website_name}")
             
@@ -90,43 +89,106 @@ class MeeshoScraper:
         
         return deals
     
+    def _extract_page_deals(self, html_content: str, limit: int, seen_products: set) -> List[Dict]:
+        """
+        Extract up to `limit` deals from one category page
+        
+        The Lexbor tree only lives for this call, so each page's tree is freed
+        before the next one is parsed.
+        
+        Args:
+            html_content: Rendered page HTML
+            limit: Maximum number of deals to return
+            seen_products: Product paths already extracted (updated in place)
+            
+        Returns:
+            List of deal dictionaries
+        """
+        # Blocked/captcha pages carry no product cards at all; a substring
+        # check is far cheaper than building a tree to find that out
+        if '/p/' not in html_content:
+            logger.warning("No products on page (blocked or empty?), skipping parse")
+            return []
+        
+        # Lexbor keeps the tree in C and answers CSS queries there
+        tree = LexborHTMLParser(html_content)
+        
+        # Find product containers or links
+        deal_containers = tree.css('a[href*="/p/"]')
+        
+        logger.info(f"Found {len(deal_containers)} products")
+        
+        # islice stops pulling links as soon as the limit is reached
+        return list(islice(self._iter_new_deals(deal_containers, seen_products), limit))
+    
+    def _iter_new_deals(self, links, seen_products: set) -> Iterator[Dict]:
+        """Yield deals for product links not extracted yet"""
+        for link in links:
+            # Several links per card point at the same product;
+            # once one of them yielded a deal skip the rest
+            product_key = (link.attributes.get('href') or '').split('?')[0]
+            if product_key in seen_products:
+                continue
+            
+            deal = self._extract_deal_from_link(link)
+            if deal:
+                seen_products.add(product_key)
+                yield deal
+    
+    def _fetch_category(self, category_url: str, browser: BrowserHelper) -> Optional[str]:
+        """Render one category page on the given browser"""
+        try:
+            # Respect rate limiting
+            rate_limiter.wait()
+            
+            logger.info(f"Fetching {category_url}...")
+            
+            # Fetch page with browser and scroll to load lazy content
+            return browser.fetch_page_with_scroll(category_url, scroll_count=3)
+        except Exception as e:
+            logger.error(f"Error fetching {category_url}: {e}")
+            return None
+    
     def _extract_deal_from_link(self, link_elem) -> Optional[Dict]:
-        """Extract deal information from a product link"""
+        """Extract deal information from a product link node (selectolax)"""
         try:
             # Product URL
-            product_url = urljoin(self.BASE_URL, link_elem.get('href', ''))
+            product_url = join_url(self.BASE_URL, link_elem.attributes.get('href') or '')
             if not product_url or not validate_url(product_url):
                 return None
             
             # Find parent container
-            container = link_elem.find_parent(['div', 'article'])
+            container = find_parent_node(link_elem, ('div', 'article'))
             if not container:
                 container = link_elem
             
             # Product name from img alt or text
-            img = container.find('img')
-            name_elem = container.find(['p', 'span', 'h2', 'h3'])
+            img = container.css_first('img')
+            name_elem = container.css_first('p, span, h2, h3')
             
             product_name = None
-            if img and img.get('alt'):
-                product_name = clean_text(img['alt'])
+            img_attrs = img.attributes if img else {}
+            if img_attrs.get('alt'):
+                product_name = clean_text(img_attrs['alt'])
             elif name_elem:
-                product_name = clean_text(name_elem.get_text())
+                product_name = clean_text(name_elem.text())
             
             if not product_name:
                 return None
             
             # Image URL
-            image_url = img.get('src') or img.get('data-src') if img else None
+            image_url = img_attrs.get('src') or img_attrs.get('data-src') if img else None
             
             # Prices
-            price_elems = container.find_all(['span', 'p'], class_=re.compile(r'price|Price'))
+            price_elems = container.css(
+                'span[class*="price"], span[class*="Price"], p[class*="price"], p[class*="Price"]'
+            )
             
             discounted_price = None
             original_price = None
             
             for elem in price_elems:
-                price_text = elem.get_text()
+                price_text = elem.text()
                 price = extract_price(price_text)
                 if price:
                     if not discounted_price:
@@ -160,7 +222,7 @@ class MeeshoScraper:
         """Extract deal information from a container element"""
         try:
             # Product name
-            name_elem = container.find(['p', 'span'], class_=re.compile(r'Name|Title'))
+            name_elem = container.find(['p', 'span'], class_=_MEESHO_NAME_RE)
             if not name_elem:
                 name_elem = container.find('img', alt=True)
             
@@ -178,7 +240,7 @@ class MeeshoScraper:
             link_elem = container if container.name == 'a' else container.find('a', href=True)
             product_url = None
             if link_elem and link_elem.get('href'):
-                product_url = urljoin(self.BASE_URL, link_elem['href'])
+                product_url = join_url(self.BASE_URL, link_elem['href'])
             
             if not product_url or not validate_url(product_url):
                 return None
@@ -188,17 +250,17 @@ class MeeshoScraper:
             image_url = img_elem['src'] if img_elem else None
             
             # Prices
-            price_elem = container.find(['span', 'p'], class_=re.compile(r'Price|price'))
-            original_price_elem = container.find(['span', 'p'], class_=re.compile(r'OriginalPrice|strike'))
+            price_elem = container.find(['span', 'p'], class_=_MEESHO_PRICE_RE)
+            original_price_elem = container.find(['span', 'p'], class_=_MEESHO_ORIG_PRICE_RE)
             
             discounted_price = extract_price(price_elem.get_text()) if price_elem else None
             original_price = extract_price(original_price_elem.get_text()) if original_price_elem else None
             
             # Extract discount percentage
-            discount_elem = container.find(['span', 'p'], class_=re.compile(r'Discount|discount'))
+            discount_elem = container.find(['span', 'p'], class_=_MEESHO_DISCOUNT_RE)
             if discount_elem:
                 discount_text = discount_elem.get_text()
-                discount_match = re.search(r'(\d+)%', discount_text)
+                discount_match = _DISCOUNT_PCT_RE.search(discount_text)
                 if discount_match and not original_price and discounted_price:
                     discount_pct = int(discount_match.group(1))
                     original_price = discounted_price / (1 - discount_pct / 100)
@@ -240,18 +302,19 @@ class MeeshoScraper:
         return words[0] if words else 'Unknown'
 
 
-def scrape_meesho_deals(max_deals: int = 50) -> List[Dict]:
+def scrape_meesho_deals(max_deals: int = 50, browser: Optional[BrowserHelper] = None) -> List[Dict]:
     """
     Main function to scrape Meesho deals
     
     Args:
         max_deals: Maximum number of deals to scrape
+        browser: Open BrowserHelper to reuse (optional)
         
     Returns:
         List of deal dictionaries
     """
     scraper = MeeshoScraper()
-    return scraper.scrape_deals(max_deals)
+    return scraper.scrape_deals(max_deals, browser=browser)
 
 
 if __name__ == "__main__":
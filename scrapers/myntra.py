@@ -3,16 +3,20 @@ Myntra Daily Deals Scraper
 Uses browser automation to handle JavaScript content
 """
 
+import functools
 import logging
+from contextlib import nullcontext
+from itertools import islice
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 import re
 
+from selectolax.lexbor import LexborHTMLParser
+
 from utils.helpers import (
     extract_price,
     calculate_discount_percentage,
     clean_text,
+    join_url,
     validate_url,
     format_deal_data,
     rate_limiter
@@ -22,6 +26,42 @@ from utils.browser_helper import BrowserHelper
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_DISCOUNT_PCT_RE = re.compile(r'(\d+)%')
+
+# Price/discount nodes on a product card, fetched in one subtree walk
+_MYNTRA_PRICE_NODES = ', '.join(
+    f'{tag}[class*="{cls}"]'
+    for cls in ('product-discountedPrice', 'product-strike', 'product-discountPercentage')
+    for tag in ('span', 'div')
+)
+
+# Common brand names matched against the product name
+_BRANDS = (
+    'Puma', 'Adidas', 'Nike', 'Reebok', 'Levis', 'H&M', 'Zara',
+    'UCB', 'Allen Solly', 'Peter England', 'Van Heusen', 'Louis Philippe',
+    'Roadster', 'HERE&NOW', 'Mast & Harbour', 'Wrogn', 'Flying Machine'
+)
+_BRAND_NAMES = {brand.lower(): brand for brand in _BRANDS}
+
+# All brands in one pattern, longest first so 'Redmi' isn't read as 'Mi';
+# word boundaries keep 'Mi' from matching inside 'mini'. The leftmost brand
+# in the name wins.
+_BRAND_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(brand) for brand in sorted(_BRANDS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _brand_for_name(product_name: str) -> str:
+    """Brand for a product name (cached; listings repeat the same names)"""
+    match = _BRAND_RE.search(product_name)
+    if match:
+        return _BRAND_NAMES[match.group(1).lower()]
+    
+    words = product_name.split()
+    return words[0] if words else 'Unknown'
+
 
 class MyntraScraper:
     """Scraper for Myntra daily deals"""
@@ -31,12 +71,14 @@ class MyntraScraper:
     def __init__(self):
         self.website_name = "Myntra"
     
-    def scrape_deals(self, max_deals: int = 50) -> List[Dict]:
+    def scrape_deals(self, max_deals: int = 50, browser: Optional[BrowserHelper] = None) -> List[Dict]:
         """
         Scrape deals from Myntra using browser automation
         
         Args:
             max_deals: Maximum number of deals to scrape
+            browser: Open BrowserHelper to reuse (optional); without one a single
+                browser is launched for all categories
             
         Returns:
             List of deal dictionaries
@@ -52,36 +94,21 @@ class MyntraScraper:
         ]
         
         try:
-            with BrowserHelper() as browser:
-                for category_url in category_urls:
+            # Reuse the caller's browser if given, else launch (and close) our
+            # own; categories render one at a time on that one browser
+            with (nullcontext(browser) if browser is not None else BrowserHelper()) as browser:
+                pages = (self._fetch_category(url, browser) for url in category_urls)
+                
+                for category_url, html_content in zip(category_urls, pages):
                     if len(deals) >= max_deals:
                         break
                     
-                    # Respect rate limiting
-                    rate_limiter.wait()
-                    
-                    logger.info(f"Fetching {category_url}...")
-                    
-                    # Fetch page with browser
-                    html_content = browser.fetch_page_with_scroll(category_url, scroll_count=2)
-                    
                     if not html_content:
                         logger.warning(f"Failed to fetch {category_url}")
                         continue
                     
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    
-                    # Find product containers
-                    deal_containers = soup.find_all('li', class_=re.compile(r'product-base'))
-                    
-                    logger.info(f"Found {len(deal_containers)} products")
-                    
-                    for container in deal_containers:
-                        if len(deals) >= max_deals:
-                            break
-                        deal = self._extract_deal_from_container(container)
-                        if deal:
-                            deals.append(deal)
+                    deals.extend(self._extract_page_deals(html_content, max_deals - len(deals)))
+                    del html_content
             
             logger.info(f"✓ Scraped {len(deals)} deals from {self.website_name}")
             
@@ -90,53 +117,108 @@ class MyntraScraper:
         
         return deals
     
+    def _extract_page_deals(self, html_content: str, limit: int) -> List[Dict]:
+        """
+        Extract up to `limit` deals from one category page
+        
+        The Lexbor tree only lives for this call, so each page's tree is freed
+        before the next one is parsed.
+        
+        Args:
+            html_content: Rendered page HTML
+            limit: Maximum number of deals to return
+            
+        Returns:
+            List of deal dictionaries
+        """
+        # Blocked/captcha pages carry no product cards at all; a substring
+        # check is far cheaper than building a tree to find that out
+        if 'product-base' not in html_content:
+            logger.warning("No products on page (blocked or empty?), skipping parse")
+            return []
+        
+        # Lexbor keeps the tree in C and answers CSS queries there
+        tree = LexborHTMLParser(html_content)
+        
+        # Find product containers
+        deal_containers = tree.css('li[class*="product-base"]')
+        
+        logger.info(f"Found {len(deal_containers)} products")
+        
+        # islice stops extracting as soon as the limit is reached
+        deals_iter = map(self._extract_deal_from_container, deal_containers)
+        return list(islice(filter(None, deals_iter), limit))
+    
+    def _fetch_category(self, category_url: str, browser: BrowserHelper) -> Optional[str]:
+        """Render one category page on the given browser"""
+        try:
+            # Respect rate limiting
+            rate_limiter.wait()
+            
+            logger.info(f"Fetching {category_url}...")
+            
+            # Fetch page with browser
+            return browser.fetch_page_with_scroll(category_url, scroll_count=2)
+        except Exception as e:
+            logger.error(f"Error fetching {category_url}: {e}")
+            return None
+    
     def _extract_deal_from_container(self, container) -> Optional[Dict]:
-        """Extract deal information from a container element"""
+        """Extract deal information from a product-base node (selectolax)"""
         try:
             # Product name
-            name_elem = container.find(['h3', 'h4'], class_=re.compile(r'product-product|product-brand'))
+            name_elem = container.css_first(
+                'h3[class*="product-product"], h3[class*="product-brand"], '
+                'h4[class*="product-product"], h4[class*="product-brand"]'
+            )
             if not name_elem:
-                name_elem = container.find('img', alt=True)
+                name_elem = container.css_first('img[alt]')
             
             product_name = None
             if name_elem:
-                if name_elem.name == 'img':
-                    product_name = name_elem.get('alt')
+                if name_elem.tag == 'img':
+                    product_name = name_elem.attributes.get('alt')
                 else:
-                    product_name = clean_text(name_elem.get_text())
+                    product_name = clean_text(name_elem.text())
             
             if not product_name:
                 return None
             
             # Product URL
-            link_elem = container.find('a', href=True)
+            link_elem = container.css_first('a[href]')
             product_url = None
             if link_elem:
-                product_url = urljoin(self.BASE_URL, link_elem['href'])
+                product_url = join_url(self.BASE_URL, link_elem.attributes.get('href') or '')
             
             if not product_url or not validate_url(product_url):
                 return None
             
             # Image URL
-            img_elem = container.find('img', src=True)
-            image_url = img_elem['src'] if img_elem else None
+            img_elem = container.css_first('img[src]')
+            image_url = img_elem.attributes.get('src') if img_elem else None
             
             # Brand
-            brand_elem = container.find(['h3'], class_=re.compile(r'product-brand'))
-            brand = clean_text(brand_elem.get_text()) if brand_elem else self._extract_brand_from_name(product_name)
+            brand_elem = container.css_first('h3[class*="product-brand"]')
+            brand = clean_text(brand_elem.text()) if brand_elem else self._extract_brand_from_name(product_name)
             
-            # Prices
-            price_elem = container.find(['span', 'div'], class_=re.compile(r'product-discountedPrice'))
-            original_price_elem = container.find(['span', 'div'], class_=re.compile(r'product-strike'))
+            # Prices and discount - first node of each kind wins
+            price_elem = original_price_elem = discount_elem = None
+            for elem in container.css(_MYNTRA_PRICE_NODES):
+                css_class = elem.attributes.get('class') or ''
+                if price_elem is None and 'product-discountedPrice' in css_class:
+                    price_elem = elem
+                elif original_price_elem is None and 'product-strike' in css_class:
+                    original_price_elem = elem
+                elif discount_elem is None and 'product-discountPercentage' in css_class:
+                    discount_elem = elem
             
-            discounted_price = extract_price(price_elem.get_text()) if price_elem else None
-            original_price = extract_price(original_price_elem.get_text()) if original_price_elem else None
+            discounted_price = extract_price(price_elem.text()) if price_elem else None
+            original_price = extract_price(original_price_elem.text()) if original_price_elem else None
             
             # Extract discount percentage
-            discount_elem = container.find(['span', 'div'], class_=re.compile(r'product-discountPercentage'))
             if discount_elem:
-                discount_text = discount_elem.get_text()
-                discount_match = re.search(r'(\d+)%', discount_text)
+                discount_text = discount_elem.text()
+                discount_match = _DISCOUNT_PCT_RE.search(discount_text)
                 if discount_match and not original_price and discounted_price:
                     discount_pct = int(discount_match.group(1))
                     original_price = discounted_price / (1 - discount_pct / 100)
@@ -170,33 +252,22 @@ class MyntraScraper:
         """Try to extract brand from product name"""
         if not product_name:
             return 'Unknown'
-        
-        fashion_brands = [
-            'Puma', 'Adidas', 'Nike', 'Reebok', 'Levis', 'H&M', 'Zara',
-            'UCB', 'Allen Solly', 'Peter England', 'Van Heusen', 'Louis Philippe',
-            'Roadster', 'HERE&NOW', 'Mast & Harbour', 'Wrogn', 'Flying Machine'
-        ]
-        
-        for brand in fashion_brands:
-            if brand.lower() in product_name.lower():
-                return brand
-        
-        words = product_name.split()
-        return words[0] if words else 'Unknown'
+        return _brand_for_name(product_name)
 
 
-def scrape_myntra_deals(max_deals: int = 50) -> List[Dict]:
+def scrape_myntra_deals(max_deals: int = 50, browser: Optional[BrowserHelper] = None) -> List[Dict]:
     """
     Main function to scrape Myntra deals
     
     Args:
         max_deals: Maximum number of deals to scrape
+        browser: Open BrowserHelper to reuse (optional)
         
     Returns:
         List of deal dictionaries
     """
     scraper = MyntraScraper()
-    return scraper.scrape_deals(max_deals)
+    return scraper.scrape_deals(max_deals, browser=browser)
 
 
 if __name__ == "__main__":
@@ -4,16 +4,18 @@ Scrapes deals from Reliance Digital's deals page
 """
 
 import logging
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from typing import List, Dict, Optional, Tuple
 import re
 
+from selectolax.lexbor import LexborHTMLParser
+
 from utils.helpers import (
     fetch_page,
+    response_encoding,
     extract_price,
     calculate_discount_percentage,
     clean_text,
+    join_url,
     validate_url,
     format_deal_data,
     rate_limiter
@@ -22,6 +24,108 @@ from utils.helpers import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Listing cards, and the list items tried when no card divs are found
+_RELIANCE_CARDS = 'div[class*="product"], div[class*="item"]'
+_RELIANCE_FALLBACK_CARDS = 'li[class*="product"]'
+
+# Class patterns for the card fields, compiled once per process
+_RELIANCE_NAME_RE = re.compile(r'product|title|name')
+_RELIANCE_BRAND_RE = re.compile(r'brand')
+_RELIANCE_PRICE_RE = re.compile(r'price|offer')
+_RELIANCE_MRP_RE = re.compile(r'old|original|mrp')
+_RELIANCE_DISCOUNT_RE = re.compile(r'discount|save')
+_DISCOUNT_PCT_RE = re.compile(r'(\d+)%')
+
+# Every element any card field could come from, matched in one walk of the
+# card (document order); _card_fields() sorts them into fields
+_RELIANCE_FIELDS_SEL = (
+    'h3[class*="product"], h3[class*="title"], h3[class*="name"], '
+    'h4[class*="product"], h4[class*="title"], h4[class*="name"], '
+    'a[class], a[href], img[alt], img[src], '
+    'span[class*="brand"], span[class*="price"], span[class*="offer"], '
+    'span[class*="old"], span[class*="original"], span[class*="mrp"], '
+    'span[class*="discount"], span[class*="save"], '
+    'div[class*="brand"], div[class*="price"], div[class*="offer"], '
+    'div[class*="discount"], div[class*="save"], '
+    'del[class*="old"], del[class*="original"], del[class*="mrp"]'
+)
+
+# (field, tags, class pattern) - first matching element per field wins
+_RELIANCE_CLASS_FIELDS = (
+    ('name', ('h3', 'h4', 'a'), _RELIANCE_NAME_RE),
+    ('brand', ('span', 'div'), _RELIANCE_BRAND_RE),
+    ('price', ('span', 'div'), _RELIANCE_PRICE_RE),
+    ('original_price', ('span', 'del'), _RELIANCE_MRP_RE),
+    ('discount', ('span', 'div'), _RELIANCE_DISCOUNT_RE),
+)
+
+
+def _card_fields(container) -> Dict:
+    """First element for each card field, collected in one selector pass"""
+    fields = {}
+    for elem in container.css(_RELIANCE_FIELDS_SEL):
+        # css() also matches the card node itself; only its contents count
+        if elem == container:
+            continue
+        tag = elem.tag
+        attrs = elem.attributes
+        if tag == 'img':
+            if 'alt' not in fields and 'alt' in attrs:
+                fields['alt'] = elem
+            if 'image' not in fields and 'src' in attrs:
+                fields['image'] = elem
+            continue
+        if tag == 'a' and 'link' not in fields and 'href' in attrs:
+            fields['link'] = elem
+        css_class = attrs.get('class') or ''
+        for field, tags, pattern in _RELIANCE_CLASS_FIELDS:
+            if field not in fields and tag in tags and pattern.search(css_class):
+                fields[field] = elem
+    return fields
+
+
+def _parse_prices(fields: Dict) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Discounted and original price for a card
+    
+    Args:
+        fields: Card fields from _card_fields()
+        
+    Returns:
+        (discounted_price, original_price); original price is derived from the
+        discount badge only when the card shows no MRP
+    """
+    price_elem = fields.get('price')
+    original_price_elem = fields.get('original_price')
+    
+    discounted_price = extract_price(price_elem.text()) if price_elem else None
+    original_price = extract_price(original_price_elem.text()) if original_price_elem else None
+    
+    # The badge text is only needed to back out a missing MRP
+    discount_elem = fields.get('discount')
+    if discount_elem and discounted_price and not original_price:
+        discount_match = _DISCOUNT_PCT_RE.search(discount_elem.text())
+        if discount_match:
+            discount_pct = int(discount_match.group(1))
+            original_price = discounted_price / (1 - discount_pct / 100)
+    
+    return discounted_price, original_price
+
+# Common brand names matched against the product name
+_BRANDS = (
+    'Samsung', 'LG', 'Sony', 'Apple', 'OnePlus', 'Xiaomi', 'Realme',
+    'Vivo', 'Oppo', 'Boat', 'JBL', 'Philips', 'Panasonic', 'Whirlpool',
+    'Godrej', 'Haier', 'Voltas', 'Blue Star', 'Dell', 'HP', 'Lenovo'
+)
+_BRAND_NAMES = {brand.lower(): brand for brand in _BRANDS}
+
+# All brands in one pattern, longest first; word boundaries keep 'HP' and
+# 'LG' from matching inside other words. The leftmost brand in the name wins.
+_BRAND_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(brand) for brand in sorted(_BRANDS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+
 
 class RelianceDigitalScraper:
     """Scraper for Reliance Digital daily deals"""
@@ -55,20 +159,41 @@ class RelianceDigitalScraper:
                 logger.error(f"Failed to fetch {self.website_name} deals page")
                 return deals
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Lexbor reads UTF-8 bytes as is; only other charsets need a
+            # decoded copy of the page
+            encoding = response_encoding(response)
+            if encoding.lower().replace('-', '') == 'utf8':
+                tree = LexborHTMLParser(response.content)
+            else:
+                tree = LexborHTMLParser(response.content.decode(encoding, 'replace'))
             
             # Find product containers
-            deal_containers = soup.find_all('div', class_=re.compile(r'product|item'))
+            deal_containers = tree.css(_RELIANCE_CARDS)
             
             if not deal_containers:
                 # Alternative selector
-                deal_containers = soup.find_all('li', class_=re.compile(r'product'))
+                deal_containers = tree.css(_RELIANCE_FALLBACK_CARDS)
             
             logger.info(f"Found {len(deal_containers)} deal containers")
             
-            for container in deal_containers[:max_deals]:
+            # A grid div matches as well as the cards inside it, so the same
+            # product shows up more than once; its first link identifies it.
+            # Duplicates don't count towards max_deals, and a product is only
+            # marked seen once a container actually yielded a deal for it
+            seen_products = set()
+            for container in deal_containers:
+                if len(deals) >= max_deals:
+                    break
+                link = container.css_first('a[href]')
+                if link is None:
+                    continue  # No product URL - nothing to extract
+                product_key = (link.attributes.get('href') or '').split('?')[0]
+                if product_key in seen_products:
+                    continue
+                
                 deal = self._extract_deal_from_container(container)
                 if deal:
+                    seen_products.add(product_key)
                     deals.append(deal)
             
             logger.info(f"✓ Scraped {len(deals)} deals from {self.website_name}")
@@ -79,55 +204,42 @@ class RelianceDigitalScraper:
         return deals
     
     def _extract_deal_from_container(self, container) -> Optional[Dict]:
-        """Extract deal information from a container element"""
+        """Extract deal information from a container node (selectolax)"""
         try:
+            fields = _card_fields(container)
+            
             # Product name
-            name_elem = container.find(['h3', 'h4', 'a'], class_=re.compile(r'product|title|name'))
-            if not name_elem:
-                name_elem = container.find('img', alt=True)
+            name_elem = fields.get('name') or fields.get('alt')
             
             product_name = None
             if name_elem:
-                if name_elem.name == 'img':
-                    product_name = name_elem.get('alt')
+                if name_elem.tag == 'img':
+                    product_name = name_elem.attributes.get('alt')
                 else:
-                    product_name = clean_text(name_elem.get_text())
+                    product_name = clean_text(name_elem.text())
             
             if not product_name:
                 return None
             
             # Product URL
-            link_elem = container.find('a', href=True)
+            link_elem = fields.get('link')
             product_url = None
             if link_elem:
-                product_url = urljoin(self.BASE_URL, link_elem['href'])
+                product_url = join_url(self.BASE_URL, link_elem.attributes.get('href') or '')
             
             if not product_url or not validate_url(product_url):
                 return None
             
             # Image URL
-            img_elem = container.find('img', src=True)
-            image_url = img_elem['src'] if img_elem else None
+            img_elem = fields.get('image')
+            image_url = img_elem.attributes.get('src') if img_elem else None
             
             # Brand
-            brand_elem = container.find(['span', 'div'], class_=re.compile(r'brand'))
-            brand = clean_text(brand_elem.get_text()) if brand_elem else self._extract_brand_from_name(product_name)
+            brand_elem = fields.get('brand')
+            brand = clean_text(brand_elem.text()) if brand_elem else self._extract_brand_from_name(product_name)
             
             # Prices
-            price_elem = container.find(['span', 'div'], class_=re.compile(r'price|offer'))
-            original_price_elem = container.find(['span', 'del'], class_=re.compile(r'old|original|mrp'))
-            
-            discounted_price = extract_price(price_elem.get_text()) if price_elem else None
-            original_price = extract_price(original_price_elem.get_text()) if original_price_elem else None
-            
-            # Extract discount percentage
-            discount_elem = container.find(['span', 'div'], class_=re.compile(r'discount|save'))
-            if discount_elem:
-                discount_text = discount_elem.get_text()
-                discount_match = re.search(r'(\d+)%', discount_text)
-                if discount_match and not original_price and discounted_price:
-                    discount_pct = int(discount_match.group(1))
-                    original_price = discounted_price / (1 - discount_pct / 100)
+            discounted_price, original_price = _parse_prices(fields)
             
             # Calculate discount
             discount_percentage = calculate_discount_percentage(original_price, discounted_price)
@@ -159,15 +271,9 @@ class RelianceDigitalScraper:
         if not product_name:
             return 'Unknown'
         
-        electronics_brands = [
-            'Samsung', 'LG', 'Sony', 'Apple', 'OnePlus', 'Xiaomi', 'Realme',
-            'Vivo', 'Oppo', 'Boat', 'JBL', 'Philips', 'Panasonic', 'Whirlpool',
-            'Godrej', 'Haier', 'Voltas', 'Blue Star', 'Dell', 'HP', 'Lenovo'
-        ]
-        
-        for brand in electronics_brands:
-            if brand.lower() in product_name.lower():
-                return brand
+        match = _BRAND_RE.search(product_name)
+        if match:
+            return _BRAND_NAMES[match.group(1).lower()]
         
         words = product_name.split()
         return words[0] if words else 'Unknown'
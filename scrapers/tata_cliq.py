@@ -5,15 +5,18 @@ Scrapes deals from Tata Cliq's deals page
 
 import logging
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 import re
 
+from bs4 import SoupStrainer
+
 from utils.helpers import (
     fetch_page,
+    make_soup,
+    response_encoding,
     extract_price,
     calculate_discount_percentage,
     clean_text,
+    join_url,
     validate_url,
     format_deal_data,
     rate_limiter
@@ -22,6 +25,11 @@ from utils.helpers import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Listing cards; only these subtrees are built when the page is parsed
+_TATA_CARD_RE = re.compile(r'ProductModule|ProductCard')
+_TATA_CARD_STRAINER = SoupStrainer('div', class_=_TATA_CARD_RE)
+_TATA_FALLBACK_STRAINER = SoupStrainer('article')
+
 
 class TataCliqScraper:
     """Scraper for Tata Cliq daily deals"""
@@ -55,13 +63,15 @@ class TataCliqScraper:
                 logger.error(f"Failed to fetch {self.website_name} deals page")
                 return deals
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            encoding = response_encoding(response)
+            soup = make_soup(response.content, from_encoding=encoding, parse_only=_TATA_CARD_STRAINER)
             
             # Find product containers
-            deal_containers = soup.find_all('div', class_=re.compile(r'ProductModule|ProductCard'))
+            deal_containers = soup.find_all('div', class_=_TATA_CARD_RE)
             
             if not deal_containers:
-                # Alternative selector
+                # Alternative selector - reparse keeping just those elements
+                soup = make_soup(response.content, from_encoding=encoding, parse_only=_TATA_FALLBACK_STRAINER)
                 deal_containers = soup.find_all('article')
             
             logger.info(f"Found {len(deal_containers)} deal containers")
@@ -100,7 +110,7 @@ class TataCliqScraper:
             link_elem = container.find('a', href=True)
             product_url = None
             if link_elem:
-                product_url = urljoin(self.BASE_URL, link_elem['href'])
+                product_url = join_url(self.BASE_URL, link_elem['href'])
             
             if not product_url or not validate_url(product_url):
                 return None
@@ -12,78 +12,9 @@ load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
-# Individual table creation queries
-tables = {
-    'amazon_deals': """
-        CREATE TABLE IF NOT EXISTS amazon_deals (
-            id BIGSERIAL PRIMARY KEY,
-            product_name TEXT NOT NULL,
-            category VARCHAR(100),
-            brand VARCHAR(100),
-            original_price DECIMAL(10, 2),
-            discounted_price DECIMAL(10, 2),
-            discount_percentage DECIMAL(5, 2),
-            product_url TEXT NOT NULL UNIQUE,
-            image_url TEXT,
-            website_name VARCHAR(50) DEFAULT 'Amazon India',
-            deal_type VARCHAR(50),
-            collected_at TIMESTAMPTZ DEFAULT NOW(),
-            updated_at TIMESTAMPTZ DEFAULT NOW()
-        );
-    """,
-    'flipkart_deals': """
-        CREATE TABLE IF NOT EXISTS flipkart_deals (
-            id BIGSERIAL PRIMARY KEY,
-            product_name TEXT NOT NULL,
-            category VARCHAR(100),
-            brand VARCHAR(100),
-            original_price DECIMAL(10, 2),
-            discounted_price DECIMAL(10, 2),
-            discount_percentage DECIMAL(5, 2),
-            product_url TEXT NOT NULL UNIQUE,
-            image_url TEXT,
-            website_name VARCHAR(50) DEFAULT 'Flipkart',
-            deal_type VARCHAR(50),
-            collected_at TIMESTAMPTZ DEFAULT NOW(),
-            updated_at TIMESTAMPTZ DEFAULT NOW()
-        );
-    """,
-    'myntra_deals': """
-        CREATE TABLE IF NOT EXISTS myntra_deals (
-            id BIGSERIAL PRIMARY KEY,
-            product_name TEXT NOT NULL,
-            category VARCHAR(100),
-            brand VARCHAR(100),
-            original_price DECIMAL(10, 2),
-            discounted_price DECIMAL(10, 2),
-            discount_percentage DECIMAL(5, 2),
-            product_url TEXT NOT NULL UNIQUE,
-            image_url TEXT,
-            website_name VARCHAR(50) DEFAULT 'Myntra',
-            deal_type VARCHAR(50),
-            collected_at TIMESTAMPTZ DEFAULT NOW(),
-            updated_at TIMESTAMPTZ DEFAULT NOW()
-        );
-    """,
-    'ajio_deals': """
-        CREATE TABLE IF NOT EXISTS ajio_deals (
-            id BIGSERIAL PRIMARY KEY,
-            product_name TEXT NOT NULL,
-            category VARCHAR(100),
-            brand VARCHAR(100),
-            original_price DECIMAL(10, 2),
-            discounted_price DECIMAL(10, 2),
-            discount_percentage DECIMAL(5, 2),
-            product_url TEXT NOT NULL UNIQUE,
-            image_url TEXT,
-            website_name VARCHAR(50) DEFAULT 'Ajio',
-            deal_type VARCHAR(50),
-            collected_at TIMESTAMPTZ DEFAULT NOW(),
-            updated_at TIMESTAMPTZ DEFAULT NOW()
-        );
-    """,
-    'meesho_deals': """
-        CREATE TABLE IF NOT EXISTS meesho_deals (
+# Every deals table has the same columns; only the website_name default differs
+_TABLE_TEMPLATE = """
+        CREATE TABLE IF NOT EXISTS {table} (
             id BIGSERIAL PRIMARY KEY,
             product_name TEXT NOT NULL,
             category VARCHAR(100),
@@ -93,47 +24,25 @@ tables = {
             discount_percentage DECIMAL(5, 2),
             product_url TEXT NOT NULL UNIQUE,
             image_url TEXT,
-            website_name VARCHAR(50) DEFAULT 'Meesho',
-            deal_type VARCHAR(50),
-            collected_at TIMESTAMPTZ DEFAULT NOW(),
-            updated_at TIMESTAMPTZ DEFAULT NOW()
-        );
-    """,
-    'tata_cliq_deals': """
-        CREATE TABLE IF NOT EXISTS tata_cliq_deals (
-            id BIGSERIAL PRIMARY KEY,
-            product_name TEXT NOT NULL,
-            category VARCHAR(100),
-            brand VARCHAR(100),
-            original_price DECIMAL(10, 2),
-            discounted_price DECIMAL(10, 2),
-            discount_percentage DECIMAL(5, 2),
-            product_url TEXT NOT NULL UNIQUE,
-            image_url TEXT,
-            website_name VARCHAR(50) DEFAULT 'Tata Cliq',
-            deal_type VARCHAR(50),
-            collected_at TIMESTAMPTZ DEFAULT NOW(),
-            updated_at TIMESTAMPTZ DEFAULT NOW()
-        );
-    """,
-    'reliance_digital_deals': """
-        CREATE TABLE IF NOT EXISTS reliance_digital_deals (
-            id BIGSERIAL PRIMARY KEY,
-            product_name TEXT NOT NULL,
-            category VARCHAR(100),
-            brand VARCHAR(100),
-            original_price DECIMAL(10, 2),
-            discounted_price DECIMAL(10, 2),
-            discount_percentage DECIMAL(5, 2),
-            product_url TEXT NOT NULL UNIQUE,
-            image_url TEXT,
-            website_name VARCHAR(50) DEFAULT 'Reliance Digital',
+            website_name VARCHAR(50) DEFAULT '{website}',
             deal_type VARCHAR(50),
             collected_at TIMESTAMPTZ DEFAULT NOW(),
             updated_at TIMESTAMPTZ DEFAULT NOW()
         );
     """
-}
+
+SITES = (
+    ('amazon_deals', 'Amazon India'),
+    ('flipkart_deals', 'Flipkart'),
+    ('myntra_deals', 'Myntra'),
+    ('ajio_deals', 'Ajio'),
+    ('meesho_deals', 'Meesho'),
+    ('tata_cliq_deals', 'Tata Cliq'),
+    ('reliance_digital_deals', 'Reliance Digital'),
+)
+
+# Individual table creation queries
+tables = {name: _TABLE_TEMPLATE.format(table=name, website=website) for name, website in SITES}
 
 print("\n" + "="*70)
 print("  DATABASE SETUP - Manual Instructions")
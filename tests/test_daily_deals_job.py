@@ -0,0 +1,72 @@
+"""Tests for the daily deals scheduler's batched upserts"""
+
+import os
+import sys
+
+import pytest
+
+# The scheduler module pulls in the scheduler, browser and database stacks
+pytest.importorskip('apscheduler')
+pytest.importorskip('pytz')
+pytest.importorskip('playwright')
+pytest.importorskip('supabase')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler.daily_deals_job import DailyDealsScheduler, _batched
+
+
+class _FakeDB:
+    def __init__(self):
+        self.batches = []
+    
+    def upsert_deals_bulk(self, website, deals):
+        self.batches.append(list(deals))
+        return {'success': len(deals), 'failed': 0}
+
+
+def _scheduler(batch_size):
+    """DailyDealsScheduler without a real database client or cron scheduler."""
+    scheduler = DailyDealsScheduler.__new__(DailyDealsScheduler)
+    scheduler.db = _FakeDB()
+    scheduler.max_deals_per_site = 50
+    scheduler.upsert_batch_size = batch_size
+    return scheduler
+
+
+def test_batched_splits_into_chunks_with_short_tail():
+    assert list(_batched(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(_batched([], 3)) == []
+
+
+def test_batched_consumes_generators_lazily():
+    consumed = []
+    
+    def deals():
+        for i in range(5):
+            consumed.append(i)
+            yield i
+    
+    batches = _batched(deals(), 2)
+    
+    assert next(batches) == [0, 1]
+    assert consumed == [0, 1]
+
+
+def test_scrape_and_store_upserts_in_batches():
+    scheduler = _scheduler(batch_size=3)
+    deals = [{'product_name': f'Deal {i}'} for i in range(7)]
+    
+    results = scheduler.scrape_and_store('amazon', lambda max_deals: iter(deals))
+    
+    assert [len(batch) for batch in scheduler.db.batches] == [3, 3, 1]
+    assert results == {'website': 'amazon', 'success': 7, 'failed': 0, 'total': 7}
+
+
+def test_scrape_and_store_without_deals_skips_the_database():
+    scheduler = _scheduler(batch_size=3)
+    
+    results = scheduler.scrape_and_store('amazon', lambda max_deals: [])
+    
+    assert scheduler.db.batches == []
+    assert results['total'] == 0
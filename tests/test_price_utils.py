@@ -0,0 +1,13 @@
+"""Regression tests for price_utils"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from price_utils import clean_price
+
+
+def test_clean_price_strips_narrow_and_thin_spaces():
+    assert clean_price('₹\u202f1\u20092,499') == 12499.0
+    assert clean_price('₹\xa01,299.50') == 1299.5
@@ -0,0 +1,203 @@
+"""Regression tests for product_scraper field extraction"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import product_scraper
+from product_scraper import (
+    AmazonScraper,
+    BaseProductScraper,
+    FlipkartScraper,
+    MeeshoScraper,
+    MyntraScraper,
+    ProductScraperFactory,
+    SeleniumPool,
+    ShopsyScraper,
+)
+
+
+def test_meesho_rating_only_checks_first_element_per_selector():
+    # sc-eDvSVe is a shared styled-components class; later <p>s are unrelated
+    soup = BeautifulSoup(
+        '<p class="sc-eDvSVe">Free Delivery</p><p class="sc-eDvSVe">Delivered in 3 days</p>',
+        'lxml'
+    )
+    rating = BaseProductScraper._first_match(
+        soup, product_scraper._MEESHO_RATING_SELS, MeeshoScraper._meesho_rating
+    )
+    
+    assert rating is None
+
+
+def test_shopsy_mrp_selectors_follow_priority_not_document_order():
+    soup = BeautifulSoup(
+        '<div class="_3auQ3N _1POkHg">₹899</div><div class="_3I9_wc _27UcVY">₹1,299</div>',
+        'lxml'
+    )
+    scraper = ShopsyScraper()
+    mrp = scraper._first_match(
+        soup, product_scraper._SHOPSY_MRP_SELS, lambda elem: scraper._clean_price(elem.get_text())
+    )
+    
+    assert mrp == 1299.0
+
+
+def test_page_price_scan_skips_per_unit_prices():
+    text = 'MRP ₹1,200/kg  ₹1,500  (₹5/g)  ₹ 2,000.50'
+    
+    assert product_scraper._PRICE_RE.findall(text) == ['1,500', '2,000.50']
+
+
+def test_scrape_async_does_not_refetch_after_failed_prefetch():
+    scraper = MyntraScraper()
+    sync_fetches = []
+    scraper._fetch_page = lambda url: sync_fetches.append(url)
+    
+    async def failed_prefetch(url, session):
+        return None
+    scraper._fetch_page_async = failed_prefetch
+    
+    result = asyncio.run(scraper.scrape_async('https://www.myntra.com/shoes/123', session=object()))
+    
+    assert sync_fetches == []
+    assert result['success'] is False
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+    
+    def quit(self):
+        self.quit_called = True
+
+
+def _fake_pool(monkeypatch):
+    """Point SeleniumPool at fake drivers; returns the list of started drivers."""
+    started = []
+    
+    def start_driver(cls):
+        driver = _FakeDriver()
+        started.append(driver)
+        cls._drivers.add(driver)
+        return driver
+    
+    monkeypatch.setattr(SeleniumPool, '_start_driver', classmethod(start_driver))
+    monkeypatch.setattr(SeleniumPool, '_idle', [])
+    monkeypatch.setattr(SeleniumPool, '_drivers', set())
+    return started
+
+
+def test_selenium_pool_caps_concurrent_drivers(monkeypatch):
+    started = _fake_pool(monkeypatch)
+    active = peak = 0
+    lock = threading.Lock()
+    
+    def fetch():
+        nonlocal active, peak
+        with SeleniumPool.driver():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+    
+    threads = [threading.Thread(target=fetch) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert peak <= SeleniumPool.MAX_DRIVERS
+    assert len(started) <= SeleniumPool.MAX_DRIVERS
+    
+    SeleniumPool.close_idle()
+    assert all(driver.quit_called for driver in started)
+    assert not SeleniumPool._drivers
+
+
+def test_selenium_pool_recycles_and_drops_failed_drivers(monkeypatch):
+    started = _fake_pool(monkeypatch)
+    monkeypatch.setattr(SeleniumPool, 'MAX_USES', 2)
+    
+    for _ in range(2):
+        with SeleniumPool.driver():
+            pass
+    assert len(started) == 1 and started[0].quit_called  # recycled after MAX_USES
+    
+    try:
+        with SeleniumPool.driver():
+            raise RuntimeError('page crashed')
+    except RuntimeError:
+        pass
+    assert len(started) == 2 and started[1].quit_called  # dropped after failure
+    assert not SeleniumPool._idle
+
+
+def test_get_scraper_matches_www_subdomain_and_exact_hosts():
+    factory = ProductScraperFactory()
+    
+    assert isinstance(factory.get_scraper('https://www.flipkart.com/p/itm1'), FlipkartScraper)
+    assert isinstance(factory.get_scraper('https://dl.flipkart.com/s/abc'), FlipkartScraper)
+    assert isinstance(factory.get_scraper('https://amazon.in/dp/B0ABCD1234'), AmazonScraper)
+    assert isinstance(factory.get_scraper('https://m.meesho.com/s/p/1'), MeeshoScraper)
+
+
+def test_get_scraper_rejects_look_alike_hosts():
+    factory = ProductScraperFactory()
+    
+    assert factory.get_scraper('https://notflipkart.com/p/itm1') is None
+    assert factory.get_scraper('https://example.com/products/1') is None
+
+
+def test_get_scraper_finds_store_url_inside_affiliate_link():
+    factory = ProductScraperFactory()
+    
+    url = 'https://linkredirect.in/visitretailer?dl=https%3A%2F%2Fwww.flipkart.com%2Fp%2Fitm1'
+    
+    assert isinstance(factory.get_scraper(url), FlipkartScraper)
+    assert isinstance(factory.get_scraper('myntra.com/shoes/123'), MyntraScraper)
+
+
+def test_scrape_products_async_keeps_order_and_isolates_errors(monkeypatch):
+    monkeypatch.setattr(product_scraper, 'AIOHTTP_AVAILABLE', False)
+    factory = ProductScraperFactory()
+    
+    async def slow_ok(url, session=None):
+        await asyncio.sleep(0.05)
+        return {'success': True, 'title': 'slow'}
+    
+    async def fast_ok(url, session=None):
+        return {'success': True, 'title': 'fast'}
+    
+    async def broken(url, session=None):
+        raise RuntimeError('parser exploded')
+    
+    monkeypatch.setattr(factory.get_scraper('https://www.flipkart.com/'), 'scrape_async', slow_ok)
+    monkeypatch.setattr(factory.get_scraper('https://www.myntra.com/'), 'scrape_async', fast_ok)
+    monkeypatch.setattr(factory.get_scraper('https://www.amazon.in/'), 'scrape_async', broken)
+    urls = [
+        'https://www.flipkart.com/p/itm1',
+        'https://www.amazon.in/dp/B0ABCD1234',
+        'https://example.com/item',
+        'https://www.myntra.com/shoes/123',
+    ]
+    
+    results = asyncio.run(factory.scrape_products_async(urls, max_concurrency=2))
+    
+    assert [result['url'] for result in results] == urls
+    assert results[0]['title'] == 'slow'
+    assert results[1] == {
+        'success': False, 'error': 'parser exploded',
+        'url': urls[1], 'domain': 'www.amazon.in',
+    }
+    assert results[2]['success'] is False
+    assert results[2]['error'] == 'No scraper available for this URL'
+    assert results[3]['title'] == 'fast'
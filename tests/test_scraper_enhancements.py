@@ -0,0 +1,64 @@
+"""Regression tests for scraper_enhancements stock detection"""
+
+import os
+import sys
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper_enhancements import CouponOfferExtractor, StockAvailabilityDetector
+
+
+def test_flipkart_ignores_sold_out_in_script_data():
+    html = (
+        '<html><body><div class="price">₹999</div>'
+        '<script>window.__INITIAL_STATE__ = {"variants": [{"status": "Sold Out"}]};</script>'
+        '</body></html>'
+    )
+    status = StockAvailabilityDetector.detect_flipkart(BeautifulSoup(html, 'html.parser'))
+    
+    assert status['in_stock'] is True
+    assert status['stock_level'] == 'unknown'
+    assert status['stock_message'] is None
+
+
+def test_flipkart_visible_sold_out_is_out_of_stock():
+    html = '<html><body><div class="stock">This item is Sold Out</div></body></html>'
+    status = StockAvailabilityDetector.detect_flipkart(BeautifulSoup(html, 'html.parser'))
+    
+    assert status['in_stock'] is False
+    assert status['stock_level'] == 'out'
+    assert status['stock_message'] == 'This item is Sold Out'
+
+
+def test_flipkart_bank_offer_with_run_together_bank_name():
+    html = (
+        '<html><body>'
+        '<div class="offer-row">10% off on SBIcard EMI transactions</div>'
+        '<div class="offer-row">Flat ₹500 off with HDFCBank debit</div>'
+        '</body></html>'
+    )
+    offers = CouponOfferExtractor.extract_flipkart(BeautifulSoup(html, 'html.parser'))
+    
+    assert offers['bank_offers'] == [
+        '10% off on SBIcard EMI transactions',
+        'Flat ₹500 off with HDFCBank debit',
+    ]
+
+
+def test_generic_only_left_phrases_are_low_stock():
+    for text in ('Only 1,200 left', 'Only a handful left!', 'only 3 left in stock'):
+        html = f'<html><body><p>{text}</p></body></html>'
+        status = StockAvailabilityDetector.detect_generic(BeautifulSoup(html, 'html.parser'), html)
+        
+        assert status['stock_level'] == 'low', text
+        assert status['in_stock'] is True
+
+
+def test_generic_out_of_stock_between_only_and_left():
+    html = '<p>Only this colour is out of stock, 2 sizes left</p>'
+    status = StockAvailabilityDetector.detect_generic(BeautifulSoup(html, 'html.parser'), html)
+    
+    assert status['in_stock'] is False
+    assert status['stock_level'] == 'out'
@@ -2,10 +2,15 @@
 
 from .helpers import (
     get_random_user_agent,
+    get_request_headers,
     fetch_page,
+    make_soup,
+    response_encoding,
+    find_parent_node,
     extract_price,
     calculate_discount_percentage,
     clean_text,
+    join_url,
     validate_url,
     format_deal_data,
     batch_items,
@@ -15,10 +20,15 @@ from .helpers import (
 
 __all__ = [
     'get_random_user_agent',
+    'get_request_headers',
     'fetch_page',
+    'make_soup',
+    'response_encoding',
+    'find_parent_node',
     'extract_price',
     'calculate_discount_percentage',
     'clean_text',
+    'join_url',
     'validate_url',
     'format_deal_data',
     'batch_items',
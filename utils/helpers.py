@@ -2,18 +2,27 @@
 Utility helpers for web scraping with anti-blocking measures
 """
 
+import functools
 import random
+import re
 import time
+import threading
 import logging
 from typing import Optional, List
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 import requests
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Price/text cleanup, compiled once instead of on every product
+_PRICE_JUNK = str.maketrans('', '', '₹, ')
+_PRICE_NUM_RE = re.compile(r'\d+\.?\d*')
+_TEXT_JUNK_RE = re.compile(r'[^\w\s\-.,()%&]')
+
 
 # User agents for rotation
 USER_AGENTS = [
@@ -33,13 +42,15 @@ def get_random_user_agent() -> str:
     return random.choice(USER_AGENTS)
 
 
-def get_session_with_retries(retries: int = 3, backoff_factor: float = 0.3) -> requests.Session:
+def get_session_with_retries(retries: int = 3, backoff_factor: float = 0.3,
+                             pool_maxsize: int = 10) -> requests.Session:
     """
     Create a requests session with retry logic
     
     Args:
         retries: Number of retry attempts
         backoff_factor: Backoff factor for retries
+        pool_maxsize: Connections kept open per host (raise for threaded use)
         
     Returns:
         Configured requests session
@@ -53,14 +64,27 @@ def get_session_with_retries(retries: int = 3, backoff_factor: float = 0.3) -> r
         allowed_methods=["HEAD", "GET", "OPTIONS"]
     )
     
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
     return session
 
 
-def fetch_page(url: str, timeout: int = 10, use_session: bool = True) -> Optional[requests.Response]:
+def get_request_headers() -> dict:
+    """Browser-like request headers with a rotated User-Agent"""
+    return {
+        'User-Agent': get_random_user_agent(),
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    }
+
+
+def fetch_page(url: str, timeout: int = 10, use_session: bool = True,
+               session: Optional[requests.Session] = None) -> Optional[requests.Response]:
     """
     Fetch a webpage with anti-blocking measures
     
@@ -68,24 +92,21 @@ def fetch_page(url: str, timeout: int = 10, use_session: bool = True) -> Optiona
         url: URL to fetch
         timeout: Request timeout in seconds
         use_session: Whether to use session with retries
+        session: Caller's session to reuse (keeps connections alive between
+            calls); a fresh one is created per call otherwise
         
     Returns:
         Response object if successful, None otherwise
     """
     try:
-        headers = {
-            'User-Agent': get_random_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        headers = get_request_headers()
         
         # Add random delay to avoid rate limiting
         time.sleep(random.uniform(1.0, 3.0))
         
-        if use_session:
+        if session is not None:
+            response = session.get(url, headers=headers, timeout=timeout)
+        elif use_session:
             session = get_session_with_retries()
             response = session.get(url, headers=headers, timeout=timeout)
         else:
@@ -100,6 +121,69 @@ def fetch_page(url: str, timeout: int = 10, use_session: bool = True) -> Optiona
         return None
 
 
+def response_encoding(response: requests.Response) -> str:
+    """
+    Get the charset declared in the Content-Type header, defaulting to UTF-8
+    
+    requests falls back to ISO-8859-1 for text/html without a charset, and
+    leaving it unset makes BeautifulSoup sniff the bytes instead.
+    
+    Args:
+        response: Response object
+        
+    Returns:
+        Encoding name
+    """
+    if 'charset' in response.headers.get('Content-Type', '').lower() and response.encoding:
+        return response.encoding
+    return 'utf-8'
+
+
+def make_soup(markup, from_encoding: Optional[str] = None,
+              parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse HTML with the lxml parser, falling back to html.parser
+    
+    Args:
+        markup: HTML string or bytes
+        from_encoding: Encoding of bytes markup (skips encoding detection)
+        parse_only: SoupStrainer limiting which tags are kept in the tree
+        
+    Returns:
+        BeautifulSoup object
+    """
+    if isinstance(markup, str):
+        from_encoding = None  # Only meaningful for bytes
+    try:
+        return BeautifulSoup(markup, 'lxml', from_encoding=from_encoding, parse_only=parse_only)
+    except Exception:
+        return BeautifulSoup(markup, 'html.parser', from_encoding=from_encoding, parse_only=parse_only)
+
+
+def find_parent_node(node, tags: tuple, class_parts: tuple = ()):
+    """
+    Walk up a selectolax node's ancestors (BeautifulSoup's find_parent)
+    
+    Args:
+        node: selectolax Node to start from (not itself a candidate)
+        tags: Acceptable ancestor tag names
+        class_parts: If given, the class attribute must contain one of these
+        
+    Returns:
+        Nearest matching ancestor Node, or None
+    """
+    parent = node.parent
+    while parent is not None:
+        if parent.tag in tags:
+            if not class_parts:
+                return parent
+            css_class = parent.attributes.get('class') or ''
+            if any(part in css_class for part in class_parts):
+                return parent
+        parent = parent.parent
+    return None
+
+
 def extract_price(price_text: str) -> Optional[float]:
     """
     Extract numeric price from text
@@ -115,12 +199,10 @@ def extract_price(price_text: str) -> Optional[float]:
     
     try:
         # Remove common currency symbols and text
-        price_text = price_text.replace('₹', '').replace('Rs.', '').replace('Rs', '')
-        price_text = price_text.replace(',', '').replace(' ', '').strip()
+        price_text = price_text.replace('Rs.', '').replace('Rs', '').translate(_PRICE_JUNK)
         
         # Extract first number found
-        import re
-        match = re.search(r'\d+\.?\d*', price_text)
+        match = _PRICE_NUM_RE.search(price_text)
         if match:
             return float(match.group())
         
@@ -167,16 +249,34 @@ def clean_text(text: str) -> str:
     text = ' '.join(text.split())
     
     # Remove special characters but keep basic punctuation
-    import re
-    text = re.sub(r'[^\w\s\-.,()%&]', '', text)
+    text = _TEXT_JUNK_RE.sub('', text)
     
     return text.strip()
 
 
+@functools.lru_cache(maxsize=4096)
+def join_url(base: str, href: str) -> str:
+    """
+    urljoin() memoised on (base, href); listing pages repeat the same hrefs
+    
+    Args:
+        base: Site base URL
+        href: Link target, relative or absolute
+        
+    Returns:
+        Absolute URL
+    """
+    return urljoin(base, href)
+
+
+@functools.lru_cache(maxsize=4096)
 def validate_url(url: str) -> bool:
     """
     Validate if a URL is well-formed
     
+    Memoised: the scheduler process re-scrapes the same product URLs every
+    run.
+    
     Args:
         url: URL to validate
         
@@ -194,24 +294,26 @@ def format_deal_data(data: dict) -> dict:
     """
     Format and validate deal data before database insertion
     
+    The dict is normalised in place rather than copied: scrapers build it only
+    to pass it here, so a second dict per deal would be pure overhead.
+    
     Args:
-        data: Raw deal data
+        data: Raw deal data (modified in place)
         
     Returns:
-        Formatted deal data
+        Formatted deal data (the same dict)
     """
-    return {
-        'product_name': clean_text(data.get('product_name', ''))[:500],
-        'category': clean_text(data.get('category', 'General'))[:100],
-        'brand': clean_text(data.get('brand', 'Unknown'))[:100],
-        'original_price': data.get('original_price'),
-        'discounted_price': data.get('discounted_price'),
-        'discount_percentage': data.get('discount_percentage'),
-        'product_url': data.get('product_url', '')[:1000],
-        'image_url': data.get('image_url', '')[:1000],
-        'website_name': data.get('website_name', '')[:50],
-        'deal_type': data.get('deal_type', 'Daily Deal')[:50],
-    }
+    data['product_name'] = clean_text(data.get('product_name', ''))[:500]
+    data['category'] = clean_text(data.get('category', 'General'))[:100]
+    data['brand'] = clean_text(data.get('brand', 'Unknown'))[:100]
+    data.setdefault('original_price', None)
+    data.setdefault('discounted_price', None)
+    data.setdefault('discount_percentage', None)
+    data['product_url'] = data.get('product_url', '')[:1000]
+    data['image_url'] = data.get('image_url', '')[:1000]
+    data['website_name'] = data.get('website_name', '')[:50]
+    data['deal_type'] = data.get('deal_type', 'Daily Deal')[:50]
+    return data
 
 
 def batch_items(items: List, batch_size: int = 10) -> List[List]:
@@ -229,20 +331,26 @@ def batch_items(items: List, batch_size: int = 10) -> List[List]:
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls"""
+    """Simple rate limiter for API calls (safe to share between threads)"""
     
     def __init__(self, calls_per_minute: int = 10):
         self.calls_per_minute = calls_per_minute
         self.min_interval = 60.0 / calls_per_minute
         self.last_call = 0
+        self._lock = threading.Lock()
     
     def wait(self):
         """Wait if necessary to respect rate limit"""
-        elapsed = time.time() - self.last_call
-        if elapsed < self.min_interval:
-            sleep_time = self.min_interval - elapsed
+        # Reserve the next slot under the lock, then sleep outside it so
+        # other threads can queue up behind us
+        with self._lock:
+            now = time.time()
+            slot = max(now, self.last_call + self.min_interval)
+            self.last_call = slot
+        
+        sleep_time = slot - now
+        if sleep_time > 0:
             time.sleep(sleep_time)
-        self.last_call = time.time()
 
 
 # Global rate limiter instance